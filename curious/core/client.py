@@ -42,7 +42,7 @@ from curious.dataclasses.user import BotUser, User
 from curious.dataclasses.webhook import Webhook
 from curious.dataclasses.widget import Widget
 from curious.exc import Unauthorized
-from curious.util import base64ify, coerce_agen, finalise
+from curious.util import base64ify_async, coerce_agen, finalise
 
 logger = logging.getLogger("curious.client")
 
@@ -346,7 +346,7 @@ class Client(object):
                 raise ValueError("Username must be 2-32 characters")
 
         if avatar:
-            avatar = base64ify(avatar)
+            avatar = await base64ify_async(avatar)
 
         await self.http.edit_user(username, avatar)
 
@@ -726,6 +726,8 @@ class HTTPClient(object):
         if embed is not None:
             payload_json["embed"] = embed
 
+        # The file is sent as a single in-memory body rather than streamed, as :meth:`.request`
+        # may need to resend the whole body when it retries.
         files = {"file": {"filename": filename, "content": file_content}}
 
         # The Discord API docs say that payload_json needs to be url-encoded, but that is a lie
@@ -1258,6 +1260,7 @@ class HTTPClient(object):
         user_limit: int = -1,
         rate_limit_per_user: int = None,
         parent_id: int = -1,
+        permission_overwrites: list = None,
     ):
         """
         Edits a channel.
@@ -1270,6 +1273,8 @@ class HTTPClient(object):
         :param user_limit: The user limit of the channel.
         :param rate_limit_per_user: The rate limit per user.
         :param parent_id: The parent ID for this channel.
+        :param permission_overwrites: The list of permission overwrites to replace the current \
+            overwrites with.
         """
         url = Endpoints.CHANNEL_BASE.format(channel_id=channel_id)
         payload = {}
@@ -1295,6 +1300,9 @@ class HTTPClient(object):
         if parent_id != -1:
             payload["parent_id"] = parent_id
 
+        if permission_overwrites is not None:
+            payload["permission_overwrites"] = permission_overwrites
+
         data = await self.patch(url, bucket="channels:{}".format(channel_id), json=payload)
         return data
 
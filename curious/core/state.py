@@ -26,6 +26,7 @@ from types import MappingProxyType
 from typing import Any, Dict, Generator, Mapping, Optional, Type, TypeVar, Union
 
 from curious.core import _current_shard
+from curious.dataclasses.bases import next_version_tag
 from curious.dataclasses.channel import Channel, ChannelType
 from curious.dataclasses.embed import Embed
 from curious.dataclasses.emoji import Emoji, PartialEmoji
@@ -37,7 +38,7 @@ from curious.dataclasses.guild import (
     VerificationLevel,
 )
 from curious.dataclasses.member import Member
-from curious.dataclasses.message import Message
+from curious.dataclasses.message import Message, _reaction_key
 from curious.dataclasses.permissions import Permissions
 from curious.dataclasses.presence import Presence
 from curious.dataclasses.reaction import Reaction
@@ -367,7 +368,7 @@ class State(object):
                 emoji_obb = emoji.get("name", None)
 
             reaction.emoji = emoji_obb
-            message.reactions.append(reaction)
+            message._add_reaction(reaction)
 
         if cache and message not in self.messages:
             self.messages.append(message)
@@ -484,6 +485,7 @@ class State(object):
         if roles:
             # clear roles
             member.role_ids = [int(rid) for rid in roles]
+            member._roles_version = next_version_tag()
 
         # update the nickname
         if old_member is not None:
@@ -708,9 +710,8 @@ class State(object):
         if not embeds:
             new_message.embeds = old_message.embeds
         else:
-            new_message.embeds = [Embed(**em) for em in event_data.get("embeds")]
-        new_message._mentions = event_data.get("mentions", old_message._mentions)
-        new_message._role_mentions = event_data.get("mention_roles", old_message._role_mentions)
+            new_message.embeds = [Embed.from_dict(em) for em in embeds]
+        new_message._update_mentions(event_data.get("mentions"), event_data.get("mention_roles"))
 
         self.messages.remove(old_message)
         self.messages.append(new_message)
@@ -752,17 +753,6 @@ class State(object):
 
         yield "message_delete_bulk", messages,
 
-    def _find_emoji(self, emoji_data: dict):
-        if emoji_data.get("id", None) is None:
-            # str only
-            return emoji_data["name"]
-
-        # try and get it from the guilds
-        for guild in self.guilds.values():
-            em = guild.emojis.get(int(emoji_data["id"]))
-            if em:
-                return em
-
     async def handle_message_reaction_add(self, event_data: dict):
         """
         Called when a reaction is added to a message.
@@ -777,22 +767,10 @@ class State(object):
         if not message:
             return
 
-        # complex filter
-        def _f(r: Reaction):
-            if not r.emoji:
-                return False
-
-            e = self._find_emoji(event_data["emoji"])
-            if not e:
-                # ¯\_(ツ)_/¯
-                return False
-
-            return r.emoji == e
-
-        reaction = next(filter(_f, message.reactions), None)
+        emoji = event_data.get("emoji", {})
+        reaction = message._find_reaction(_reaction_key(emoji))
 
         if not reaction:
-            emoji = event_data.get("emoji", {})
             # no useful args are added
             reaction = Reaction()
 
@@ -806,7 +784,7 @@ class State(object):
                 emoji_obb = emoji.get("name", None)
 
             reaction.emoji = emoji_obb
-            message.reactions.append(reaction)
+            message._add_reaction(reaction)
         else:
             # up the count
             reaction.count += 1
@@ -831,8 +809,7 @@ class State(object):
         if not message:
             return
 
-        reactions = message.reactions.copy()
-        message.reactions = []
+        reactions = message._clear_reactions()
         yield "message_reaction_remove_all", message, reactions,
 
     async def handle_message_reaction_remove(self, event_data: dict):
@@ -849,16 +826,7 @@ class State(object):
         if not message:
             return
 
-        def _f(r: Reaction):
-            if not r.emoji:
-                return False
-
-            e = self._find_emoji(event_data["emoji"])
-            if not e:
-                # ¯\_(ツ)_/¯
-                return False
-
-        reaction = next(filter(_f, message.reactions), None)
+        reaction = message._find_reaction(_reaction_key(event_data.get("emoji", {})))
         if not reaction:
             # nothing to do
             return
@@ -868,7 +836,7 @@ class State(object):
             reaction.me = False
 
         if reaction.count == 0:
-            message.reactions.remove(reaction)
+            message._remove_reaction(reaction)
 
         yield "message_reaction_remove", message, reaction,
 
@@ -886,6 +854,7 @@ class State(object):
         member.guild_id = guild.id
 
         guild._members[member.id] = member
+        guild._members_version = next_version_tag()
         guild.member_count += 1
         yield "guild_member_add", member,
 
@@ -899,8 +868,15 @@ class State(object):
         if not guild:
             return
 
-        member_id = int(event_data["user"]["id"])
+        user_data = event_data["user"]
+        member_id = int(user_data["id"])
         member = guild._members.pop(member_id, None)
+        if member is not None:
+            guild._members_version = next_version_tag()
+
+        guild._members_by_tag.pop(
+            (user_data.get("username"), user_data.get("discriminator")), None
+        )
 
         guild.member_count -= 1
         if not member:
@@ -939,6 +915,7 @@ class State(object):
         # Overwrite roles, we want to get rid of any roles that are stale.
         if "roles" in event_data:
             member.role_ids = [int(i) for i in event_data.get("roles", [])]
+            member._roles_version = next_version_tag()
 
         guild._members[member.id] = member
         member.nickname = event_data.get("nick", member.nickname.value)
@@ -1062,6 +1039,7 @@ class State(object):
             role = Role(**role_data)
             role.guild_id = guild.id
             guild._roles[role_id] = role
+            guild._roles_version = next_version_tag()
         else:
             # thinking
             role = guild._roles[role_id]
@@ -1101,6 +1079,7 @@ class State(object):
         role.mentionable = event_data.get("mentionable")
         role.managed = event_data.get("managed")
         role.permissions = Permissions(event_data.get("permissions", 0))
+        guild._roles_version = next_version_tag()
 
         yield "guild_role_update", old_role, role,
 
@@ -1125,6 +1104,8 @@ class State(object):
             except ValueError:
                 continue
 
+        guild._roles_version = next_version_tag()
+
         yield "guild_role_delete", role,
 
     async def handle_typing_start(self, event_data: dict):
@@ -21,6 +21,8 @@ class Attachment(Dataclass):
     Represents an attachment.
     """
 
+    __slots__ = ("filename", "size", "url", "proxy_url", "height", "width")
+
     def __init__(self, id: int, **kwargs):
         super().__init__(id)
 
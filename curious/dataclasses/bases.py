@@ -19,7 +19,7 @@ Base classes that all dataclasses inherit from.
 .. currentmodule:: curious.dataclasses.bases
 """
 import datetime
-import inspect
+import itertools
 import sys
 import threading
 from contextlib import contextmanager
@@ -29,6 +29,17 @@ DISCORD_EPOCH = 1420070400000
 _allowing_external_makes = threading.local()
 _allowing_external_makes.flag = False
 
+# Version tags are drawn from one process-wide counter, so that a tag belonging to a replaced
+# object can never collide with the tag of its replacement.
+_version_tags = itertools.count()
+
+
+def next_version_tag() -> int:
+    """
+    :return: A new, never before seen version tag, used to invalidate cached values.
+    """
+    return next(_version_tags)
+
 
 @contextmanager
 def allow_external_makes() -> None:
@@ -98,8 +109,8 @@ class Dataclass(Snowflaked):
         """
         if __debug__ and _allowing_external_makes.flag is False:
             try:
-                frameinfo = inspect.stack()[1]
-                frame = frameinfo.frame
+                # opt: inspect.stack() builds a FrameInfo (with source context) for every frame
+                frame = sys._getframe(1)
                 f_globals = frame.f_globals
                 f_name = frame.f_code.co_name
                 module = f_globals.get("__name__", None)
@@ -128,7 +139,7 @@ class Dataclass(Snowflaked):
                             "``with allow_external_makes)``."
                         )
             finally:
-                del frameinfo, frame
+                del frame
 
         return object.__new__(cls)
 
@@ -19,12 +19,13 @@ Wrappers for Channel objects.
 .. currentmodule:: curious.dataclasses.channel
 """
 import collections
-import copy
 import enum
 import inspect
 import pathlib
 import time
-from math import floor
+import weakref
+from functools import reduce
+from operator import or_
 from os import PathLike
 from types import MappingProxyType
 from typing import (
@@ -37,6 +38,7 @@ from typing import (
     List,
     Mapping,
     Optional,
+    Tuple,
     Union,
 )
 
@@ -54,10 +56,91 @@ from curious.dataclasses import (
     user as dt_user,
     webhook as dt_webhook,
 )
-from curious.dataclasses.bases import Dataclass, Snowflaked
+from curious.dataclasses.bases import DISCORD_EPOCH, Dataclass, Snowflaked, next_version_tag
 from curious.dataclasses.embed import Embed
 from curious.exc import CuriousError, ErrorCode, Forbidden, HTTPException, PermissionsError
-from curious.util import AsyncIteratorWrapper, base64ify, deprecated, safe_generator
+from curious.util import AsyncIteratorWrapper, base64ify_async, deprecated, safe_generator
+
+# These are plain bitfields, as Permissions objects are mutable and can't be shared.
+_PERMISSION_BITS = dt_permissions.PERMISSION_BITS
+#: The bit of the administrator permission.
+_ADMINISTRATOR = _PERMISSION_BITS["administrator"]
+#: The bits of the permissions checked by :class:`.ChannelMessageWrapper`.
+_SEND_MESSAGES = _PERMISSION_BITS["send_messages"]
+_MANAGE_MESSAGES = _PERMISSION_BITS["manage_messages"]
+_EMBED_LINKS = _PERMISSION_BITS["embed_links"]
+_ATTACH_FILES = _PERMISSION_BITS["attach_files"]
+_READ_MESSAGE_HISTORY = _PERMISSION_BITS["read_message_history"]
+#: The bits of the permissions checked by :class:`.Channel`.
+_CREATE_INSTANT_INVITE = _PERMISSION_BITS["create_instant_invite"]
+_MANAGE_CHANNELS = _PERMISSION_BITS["manage_channels"]
+_MANAGE_ROLES = _PERMISSION_BITS["manage_roles"]
+_MANAGE_WEBHOOKS = _PERMISSION_BITS["manage_webhooks"]
+#: The bitfield of :meth:`.Permissions.all`.
+_ALL_PERMISSIONS = dt_permissions.Permissions.all().bitfield
+#: The bitfield of the permissions in a private channel.
+_PRIVATE_PERMISSIONS = sum(
+    _PERMISSION_BITS[name]
+    for name in (
+        "add_reactions",
+        "read_messages",
+        "send_messages",
+        "send_tts_messages",
+        "embed_links",
+        "attach_files",
+        "read_message_history",
+        "mention_everyone",
+        "use_external_emojis",
+    )
+)
+
+#: The maximum number of HTTP requests that can be in flight for a single channel at once.
+_HTTP_CONCURRENCY = 8
+
+#: The semaphores bounding the in-flight HTTP requests of each channel, by channel ID.
+#: These are weak, so a semaphore only lives whilst a request holds it; copies of a channel find the
+#: same one by ID, and channels that never make a request don't carry one.
+_http_semaphores = weakref.WeakValueDictionary()
+
+#: The default for arguments where None has a meaning of its own, i.e. "don't change this".
+_UNSET = object()
+
+#: A shared, read-only empty mapping, used for channel attributes that are never populated.
+_EMPTY_MAPPING: Mapping = MappingProxyType({})
+
+
+def _bulk_delete_min_id() -> int:
+    """
+    :return: The lowest message ID that can be bulk deleted (i.e. at most 14 days old).
+    """
+    now = int(time.time() * 1000)
+    return (now - 14 * 24 * 60 * 60 * 1000 - DISCORD_EPOCH) << 22
+
+
+async def _read_upload_bytes(fp: bytes) -> Tuple[bytes, Optional[str]]:
+    return fp, None
+
+
+async def _read_upload_path(fp: "Union[str, PathLike]") -> Tuple[bytes, Optional[str]]:
+    path = pathlib.Path(fp)
+    return await anyio.run_in_thread(path.read_bytes), path.parts[-1]
+
+
+async def _read_upload_file(fp: IO) -> Tuple[bytes, Optional[str]]:
+    file_content = await anyio.run_in_thread(fp.read)
+    if isinstance(file_content, str):
+        file_content = file_content.encode("utf-8")
+
+    return file_content, None
+
+
+#: The readers for :meth:`.ChannelMessageWrapper.upload`, keyed by the exact type of the file.
+#: Each reader returns the file content and the default filename, if any.
+_UPLOAD_READERS = {
+    bytes: _read_upload_bytes,
+    str: _read_upload_path,
+    type(pathlib.Path()): _read_upload_path,
+}
 
 
 class ChannelType(enum.IntEnum):
@@ -90,7 +173,13 @@ class ChannelType(enum.IntEnum):
         """
         :return: If this channel type has messages.
         """
-        return self not in [ChannelType.VOICE, ChannelType.CATEGORY]
+        return self not in _NO_MESSAGE_TYPES
+
+
+#: The types of channels that don't have messages.
+_NO_MESSAGE_TYPES = frozenset({ChannelType.VOICE, ChannelType.CATEGORY})
+#: The types of private channels.
+_DM_TYPES = frozenset({ChannelType.PRIVATE, ChannelType.GROUP})
 
 
 class HistoryIterator(collections.AsyncIterator):
@@ -129,7 +218,10 @@ class HistoryIterator(collections.AsyncIterator):
         self.channel = channel
 
         #: The current storage of messages.
-        self.messages = collections.deque()
+        self.messages: "List[dt_message.Message]" = []
+
+        #: The index of the next message in :attr:`.messages` to return.
+        self._head = 0
 
         #: The current count of messages iterated over.
         #: This is used to know when to automatically fill new messages.
@@ -171,33 +263,48 @@ class HistoryIterator(collections.AsyncIterator):
             return
 
         client = get_current_client()
-        if self.before:
-            messages = await client.http.get_message_history(
-                self.channel.id, before=self.last_message_id, limit=to_get
-            )
-        else:
-            messages = await client.http.get_message_history(
-                self.channel.id, after=self.last_message_id
-            )
-            messages = reversed(messages)
+        async with self.channel._http_semaphore:
+            if self.before:
+                messages = await client.http.get_message_history(
+                    self.channel.id, before=self.last_message_id, limit=to_get
+                )
+            else:
+                messages = await client.http.get_message_history(
+                    self.channel.id, after=self.last_message_id
+                )
 
-        for message in messages:
-            self.messages.append(client.state.make_message(message))
+        if not self.before:
+            messages.reverse()
+
+        # drop anything that has already been consumed by __anext__
+        if self._head:
+            del self.messages[: self._head]
+            self._head = 0
+
+        make_message = client.state.make_message
+        self.messages.extend([make_message(message) for message in messages])
 
     async def __anext__(self) -> "dt_message.Message":
         self.current_count += 1
         if self.current_count == self.max_messages:
             raise StopAsyncIteration
 
-        if len(self.messages) <= 0:
+        if self._head >= len(self.messages):
             await self.fill_messages()
 
         try:
-            message = self.messages.popleft()
+            message = self.messages[self._head]
         except IndexError:
             # No messages to fill, so self._fill_messages didn't return any
             # This signals the end of iteration.
             raise StopAsyncIteration
+
+        self._head += 1
+        if self._head == len(self.messages):
+            # drained, so reset the buffer instead of shifting it
+            self.messages.clear()
+            self._head = 0
+
         self.last_message_id = message.id
 
         return message
@@ -268,9 +375,7 @@ class ChannelMessageWrapper(object):
         :param before: The snowflake ID to get messages before.
         :param after: The snowflake ID to get messages after.
         """
-        if self.channel.guild:
-            if not self.channel.effective_permissions(self.channel.guild.me).read_message_history:
-                raise PermissionsError("read_message_history")
+        self.channel._require_permission(_READ_MESSAGE_HISTORY, "read_message_history")
 
         return HistoryIterator(self.channel, before=before, after=after, max_messages=limit)
 
@@ -295,9 +400,9 @@ class ChannelMessageWrapper(object):
         if not self.channel.type.has_messages():
             raise CuriousError("Cannot send messages to a voice channel")
 
-        if self.channel.guild:
-            if not self.channel.effective_permissions(self.channel.guild.me).send_messages:
-                raise PermissionsError("send_messages")
+        bitfield = self.channel._me_bitfield()
+        if bitfield is not None and not bitfield & _SEND_MESSAGES:
+            raise PermissionsError("send_messages")
 
         if not isinstance(content, str) and content is not None:
             content = str(content)
@@ -307,10 +412,7 @@ class ChannelMessageWrapper(object):
             if not embed:
                 raise CuriousError("Cannot send an empty message")
 
-            if (
-                self.channel.guild
-                and not self.channel.effective_permissions(self.channel.guild.me).embed_links
-            ):
+            if bitfield is not None and not bitfield & _EMBED_LINKS:
                 raise PermissionsError("embed_links")
         else:
             if content and len(content) > 2000:
@@ -320,7 +422,8 @@ class ChannelMessageWrapper(object):
             embed = embed.to_dict()
 
         client = get_current_client()
-        data = await client.http.send_message(self.channel.id, content, tts=tts, embed=embed)
+        async with self.channel._http_semaphore:
+            data = await client.http.send_message(self.channel.id, content, tts=tts, embed=embed)
         obb = client.state.make_message(data, cache=True)
 
         return obb
@@ -360,33 +463,29 @@ class ChannelMessageWrapper(object):
         if not self.channel.type.has_messages():
             raise CuriousError("Cannot send messages to a voice channel")
 
-        if self.channel.guild:
-            if not self.channel.effective_permissions(self.channel.guild.me).send_messages:
+        bitfield = self.channel._me_bitfield()
+        if bitfield is not None:
+            if not bitfield & _SEND_MESSAGES:
                 raise PermissionsError("send_messages")
 
-            if not self.channel.effective_permissions(self.channel.guild.me).attach_files:
+            if not bitfield & _ATTACH_FILES:
                 raise PermissionsError("attach_files")
 
-        if isinstance(fp, bytes):
-            file_content = fp
-        elif isinstance(fp, pathlib.Path):
-            if filename is None:
-                filename = fp.parts[-1]
-
-            file_content = fp.read_bytes()
-        elif isinstance(fp, (str, PathLike)):
-            path = pathlib.Path(fp)
-            if filename is None:
-                filename = path.parts[-1]
-
-            file_content = path.read_bytes()
-        elif isinstance(fp, IO) or hasattr(fp, "read"):
-            file_content = fp.read()
+        reader = _UPLOAD_READERS.get(type(fp))
+        if reader is None:
+            # slow path, for subclasses and file-likes
+            if isinstance(fp, bytes):
+                reader = _read_upload_bytes
+            elif isinstance(fp, (str, PathLike)):
+                reader = _read_upload_path
+            elif isinstance(fp, IO) or hasattr(fp, "read"):
+                reader = _read_upload_file
+            else:
+                raise ValueError("Got unknown type for upload")
 
-            if isinstance(file_content, str):
-                file_content = file_content.encode("utf-8")
-        else:
-            raise ValueError("Got unknown type for upload")
+        file_content, default_filename = await reader(fp)
+        if filename is None:
+            filename = default_filename
 
         if filename is None:
             filename = "unknown.bin"
@@ -394,9 +493,14 @@ class ChannelMessageWrapper(object):
         embed = message_embed.to_dict() if message_embed else None
 
         client = get_current_client()
-        data = await client.http.send_file(
-            self.channel.id, file_content, filename=filename, content=message_content, embed=embed
-        )
+        async with self.channel._http_semaphore:
+            data = await client.http.send_file(
+                self.channel.id,
+                file_content,
+                filename=filename,
+                content=message_content,
+                embed=embed,
+            )
         obb = client.state.make_message(data, cache=False)
         return obb
 
@@ -421,11 +525,9 @@ class ChannelMessageWrapper(object):
         :param messages: A list of :class:`.Message` objects to delete.
         :return: The number of messages deleted.
         """
-        if self.channel.guild:
-            if not self.channel.effective_permissions(self.channel.guild.me).manage_messages:
-                raise PermissionsError("manage_messages")
+        self.channel._require_permission(_MANAGE_MESSAGES, "manage_messages")
 
-        minimum_allowed = floor((time.time() - 14 * 24 * 60 * 60) * 1000.0 - 1420070400000) << 22
+        minimum_allowed = _bulk_delete_min_id()
         ids = []
         for message in messages:
             if message.id < minimum_allowed:
@@ -434,7 +536,8 @@ class ChannelMessageWrapper(object):
 
             ids.append(message.id)
 
-        await get_current_client().http.delete_multiple_messages(self.channel.id, ids)
+        async with self.channel._http_semaphore:
+            await get_current_client().http.delete_multiple_messages(self.channel.id, ids)
 
         return len(ids)
 
@@ -478,65 +581,104 @@ class ChannelMessageWrapper(object):
             cannot be bulk deleted.
         :return: The number of messages deleted.
         """
-        if self.channel.guild:
-            if (
-                not self.channel.effective_permissions(self.channel.guild.me).manage_messages
-                and not fallback_from_bulk
-            ):
-                raise PermissionsError("manage_messages")
+        bitfield = self.channel._me_bitfield()
+        if bitfield is not None and not bitfield & _MANAGE_MESSAGES and not fallback_from_bulk:
+            raise PermissionsError("manage_messages")
 
-        checks = []
-        if author:
-            checks.append(lambda m: m.author == author)
+        # falsey filters are ignored, so normalise them to None
+        author = author or None
+        content = content or None
+        predicate = predicate or None
 
-        if content:
-            checks.append(lambda m: m.content == content)
+        def check(message: "dt_message.Message") -> bool:
+            return (
+                (author is None or message.author == author)
+                and (content is None or message.content == content)
+                and (predicate is None or predicate(message))
+            )
 
-        if predicate:
-            checks.append(predicate)
+        minimum_allowed = _bulk_delete_min_id()
+        can_bulk_delete = True
+        deleted = 0
+
+        # Messages are deleted in chunks of 100 as the history is fetched, rather than collecting
+        # the entire history first.
+        # The messages themselves are only kept if we might need to fall back to deleting them one
+        # by one; otherwise, only their IDs are needed.
+        message_ids = []
+        messages = [] if fallback_from_bulk else None
+        async for message in self.get_history(limit=limit):
+            if not check(message):
+                continue
 
-        to_delete = []
-        history = self.get_history(limit=limit)
+            if message.id < minimum_allowed:
+                msg = f"Cannot delete message id {message.id} older than {minimum_allowed}"
+                raise CuriousError(msg)
 
-        async for message in history:
-            if all(check(message) for check in checks):
-                to_delete.append(message)
+            message_ids.append(message.id)
+            if messages is not None:
+                messages.append(message)
 
-        can_bulk_delete = True
+            if len(message_ids) < 100:
+                continue
 
-        # Split into chunks of 100.
-        message_chunks = [to_delete[i : i + 100] for i in range(0, len(to_delete), 100)]
-        minimum_allowed = floor((time.time() - 14 * 24 * 60 * 60) * 1000.0 - 1420070400000) << 22
-        for chunk in message_chunks:
+            can_bulk_delete = await self._purge_chunk(
+                message_ids, messages, can_bulk_delete, fallback_from_bulk
+            )
+            deleted += len(message_ids)
             message_ids = []
-            for message in chunk:
-                if message.id < minimum_allowed:
-                    msg = f"Cannot delete message id {message.id} older than {minimum_allowed}"
-                    raise CuriousError(msg)
+            messages = [] if fallback_from_bulk else None
+
+        if message_ids:
+            await self._purge_chunk(message_ids, messages, can_bulk_delete, fallback_from_bulk)
+            deleted += len(message_ids)
+
+        return deleted
 
-                message_ids.append(message.id)
+    async def _purge_chunk(
+        self,
+        message_ids: List[int],
+        messages: "Optional[List[dt_message.Message]]",
+        can_bulk_delete: bool,
+        fallback_from_bulk: bool,
+    ) -> bool:
+        """
+        Deletes a single chunk of up to 100 messages for :meth:`.purge`.
 
-            # First, try and bulk delete all the messages.
-            if can_bulk_delete:
-                try:
+        :param message_ids: The IDs of the messages to delete.
+        :param messages: The messages to delete. This is only needed if ``fallback_from_bulk`` \
+            is True.
+        :return: If bulk delete can still be used for the next chunk.
+        """
+        # First, try and bulk delete all the messages.
+        if can_bulk_delete:
+            try:
+                async with self.channel._http_semaphore:
                     await get_current_client().http.delete_multiple_messages(
                         self.channel.id, message_ids
                     )
-                except Forbidden:
-                    # We might not have MANAGE_MESSAGES.
-                    # Check if we should fallback on normal delete.
-                    can_bulk_delete = False
-                    if not fallback_from_bulk:
-                        # Don't bother, actually.
-                        raise
-
-            # This is an `if not` instead of an `else` because `can_bulk_delete` might've changed.
-            if not can_bulk_delete:
-                # Instead, just delete() the message.
-                for message in chunk:
+            except Forbidden:
+                # We might not have MANAGE_MESSAGES.
+                # Check if we should fallback on normal delete.
+                can_bulk_delete = False
+                if not fallback_from_bulk:
+                    # Don't bother, actually.
+                    raise
+
+        # This is an `if not` instead of an `else` because `can_bulk_delete` might've changed.
+        if not can_bulk_delete:
+            # Instead, just delete() the messages, a few at a time.
+            semaphore = anyio.create_semaphore(5)
+
+            async def _delete(message: "dt_message.Message"):
+                async with semaphore:
                     await message.delete()
 
-        return len(to_delete)
+            async with anyio.create_task_group() as tg:
+                for message in messages:
+                    await tg.spawn(_delete, message)
+
+        return can_bulk_delete
 
     async def get(self, message_id: int) -> "dt_message.Message":
         """
@@ -550,9 +692,7 @@ class ChannelMessageWrapper(object):
         :return: A new :class:`.Message` object.
         :raises CuriousError: If the message could not be found.
         """
-        if self.channel.guild:
-            if not self.channel.effective_permissions(self.channel.guild.me).read_message_history:
-                raise PermissionsError("read_message_history")
+        self.channel._require_permission(_READ_MESSAGE_HISTORY, "read_message_history")
 
         client = get_current_client()
         cached_message = client.state.find_message(message_id)
@@ -560,7 +700,8 @@ class ChannelMessageWrapper(object):
             return cached_message
 
         try:
-            data = await client.http.get_message(self.channel.id, message_id)
+            async with self.channel._http_semaphore:
+                data = await client.http.get_message(self.channel.id, message_id)
         except HTTPException as e:
             # transform into a CuriousError if it wasn't found
             if e.error_code == ErrorCode.UNKNOWN_MESSAGE:
@@ -606,7 +747,27 @@ class Channel(Dataclass):
     Represents a channel object.
     """
 
-    _NONE = object()
+    __slots__ = (
+        "name",
+        "topic",
+        "guild_id",
+        "parent_id",
+        "type",
+        "_messages",
+        "nsfw",
+        "rate_limit_per_user",
+        "_recipients",
+        "_recipients_view",
+        "position",
+        "_last_message_id",
+        "owner_id",
+        "icon_hash",
+        "_overwrites",
+        "_overwrites_view",
+        "_overwrite_bits",
+        "_overwrites_version",
+        "_perm_cache",
+    )
 
     def __init__(self, **kwargs) -> None:
         super().__init__(kwargs.get("id"))
@@ -639,18 +800,23 @@ class Channel(Dataclass):
         #: The rate limit per user (each user can send 1 message every N seconds where N = this num)
         self.rate_limit_per_user: int = kwargs.get("rate_limit_per_user", 0)
 
+        # NB: guild channels from a GUILD_CREATE don't have a guild_id yet, so check the type
+        # rather than using ``self.private``.
+        is_dm = self.type in _DM_TYPES
+
         #: If private, the mapping of :class:`.User` that are in this channel.
-        self._recipients: Dict[int, dt_user.User] = {}
+        self._recipients: Dict[int, dt_user.User] = {} if is_dm else _EMPTY_MAPPING
+        self._recipients_view = MappingProxyType(self._recipients) if is_dm else _EMPTY_MAPPING
 
-        if self.private:
+        if is_dm:
+            client = get_current_client()
             for recipient in kwargs.get("recipients", []):
-                u = get_current_client().state.make_user(recipient)
+                u = client.state.make_user(recipient)
                 self._recipients[u.id] = u
 
             if self.type == ChannelType.GROUP:
                 # append the current user
-                client = get_current_client()
-                self._recipients[client.user.id] = get_current_client().user
+                self._recipients[client.user.id] = client.user
 
         #: The position of this channel.
         self.position: int = kwargs.get("position", 0)
@@ -673,8 +839,34 @@ class Channel(Dataclass):
         #: The icon hash of the channel.
         self.icon_hash: Optional[int] = kwargs.get("icon", None)
 
+        # These are replaced by :meth:`._update_overwrites`, which every guild channel goes through.
         #: The internal overwrites for this channel.
-        self._overwrites: Dict[int, dt_permissions.Overwrite] = {}
+        self._overwrites: Dict[int, dt_permissions.Overwrite] = _EMPTY_MAPPING
+        self._overwrites_view = _EMPTY_MAPPING
+
+        #: The raw (allow, deny) bitfields of :attr:`._overwrites`, used for permission checks.
+        self._overwrite_bits: Dict[int, Tuple[int, int]] = _EMPTY_MAPPING
+
+        #: The version tag of the overwrites. This must be bumped whenever they change.
+        self._overwrites_version = next_version_tag()
+
+        #: The cache of effective permission bitfields, keyed by member ID.
+        #: Each entry is stored alongside the version tags it was computed with.
+        self._perm_cache: Dict[int, Tuple[Tuple[int, int, int], int]] = (
+            _EMPTY_MAPPING if is_dm else {}
+        )
+
+    @property
+    def _http_semaphore(self) -> "anyio.Semaphore":
+        """
+        :return: The semaphore that every HTTP request made for this channel is sent under.
+        """
+        semaphore = _http_semaphores.get(self.id)
+        if semaphore is None:
+            # NB: this is only reached from async methods, as it needs to be made in the event loop
+            semaphore = _http_semaphores[self.id] = anyio.create_semaphore(_HTTP_CONCURRENCY)
+
+        return semaphore
 
     def __repr__(self) -> str:
         return (
@@ -694,6 +886,9 @@ class Channel(Dataclass):
             raise CuriousError("A channel without a guild cannot have overwrites")
 
         self._overwrites = {}
+        self._overwrites_view = MappingProxyType(self._overwrites)
+        self._overwrite_bits = {}
+        self._overwrites_version = next_version_tag()
 
         for overwrite in overwrites:
             id_ = int(overwrite["id"])
@@ -704,10 +899,12 @@ class Channel(Dataclass):
             else:
                 obb = self.guild._roles.get(id_)
 
-            self._overwrites[id_] = dt_permissions.Overwrite(
+            overwrite_obb = dt_permissions.Overwrite(
                 allow=overwrite["allow"], deny=overwrite["deny"], obb=obb, channel_id=self.id
             )
-            self._overwrites[id_]._immutable = True
+            overwrite_obb._immutable = True
+            self._overwrites[id_] = overwrite_obb
+            self._overwrite_bits[id_] = (overwrite_obb.allow.bitfield, overwrite_obb.deny.bitfield)
 
     @property
     def guild(self) -> "Optional[dt_guild.Guild]":
@@ -738,7 +935,7 @@ class Channel(Dataclass):
         """
         :return: A mapping of int -> :class:`.User` for the recipients of this private chat.
         """
-        return MappingProxyType(self._recipients)
+        return self._recipients_view
 
     @property
     def user(self) -> "Optional[dt_user.User]":
@@ -796,7 +993,15 @@ class Channel(Dataclass):
         :param name: The name of the channel to get.
         :return: A :class:`.Channel` if the channel was find
         """
-        return next(filter(lambda channel: channel.name == name, self.children), None)
+        guild = self.guild
+        if not guild:
+            return None
+
+        for channel in guild._channels.values():
+            if channel.parent_id == self.id and channel.name == name:
+                return channel
+
+        return None
 
     @property
     def messages(self) -> ChannelMessageWrapper:
@@ -852,44 +1057,88 @@ class Channel(Dataclass):
         """
         :return: A mapping of target_id -> :class:`.Overwrite` for this channel.
         """
-        return MappingProxyType(self._overwrites)
+        return self._overwrites_view
 
     def effective_permissions(self, member: "dt_member.Member") -> "dt_permissions.Permissions":
         """
         Gets the effective permissions for the given member.
         """
-        if not self.guild:
-            return dt_permissions.Permissions(515136)
+        guild = self.guild
+        if not guild:
+            return dt_permissions.Permissions(_PRIVATE_PERMISSIONS)
+
+        return dt_permissions.Permissions(self._effective_bitfield(guild, member))
+
+    def _me_bitfield(self) -> Optional[int]:
+        """
+        :return: The effective permissions bitfield for the current member, or None if this \
+            channel has no guild.
+        """
+        guild = self.guild
+        if not guild:
+            return None
 
-        permissions = dt_permissions.Permissions(self.guild.default_role.permissions.bitfield)
+        return self._effective_bitfield(guild, guild.me)
 
-        for role in member.roles:
-            permissions.bitfield |= role.permissions.bitfield
+    def _require_permission(self, bit: int, name: str) -> None:
+        """
+        Checks that the current member has a permission in this channel, if it is in a guild.
+
+        :param bit: The bit of the permission to check.
+        :param name: The name of the permission, for the error.
+        :raises PermissionsError: If the current member doesn't have the permission.
+        """
+        bitfield = self._me_bitfield()
+        if bitfield is not None and not bitfield & bit:
+            raise PermissionsError(name)
 
-        if permissions.administrator:
-            return dt_permissions.Permissions.all()
+    def _effective_bitfield(self, guild: "dt_guild.Guild", member: "dt_member.Member") -> int:
+        """
+        Gets the effective permissions bitfield for the given member, using the cache if the
+        member's roles, the guild's roles and the overwrites are all unchanged.
+        """
+        tag = (member._roles_version, guild._roles_version, self._overwrites_version)
+        cached = self._perm_cache.get(member.id)
+        if cached is not None and cached[0] == tag:
+            return cached[1]
 
-        overwrites_everyone = self._overwrites.get(self.guild.default_role.id)
-        if overwrites_everyone:
-            permissions.bitfield &= ~overwrites_everyone.deny.bitfield
-            permissions.bitfield |= overwrites_everyone.allow.bitfield
+        bitfield = self._calculate_permissions(guild, member)
+        self._perm_cache[member.id] = (tag, bitfield)
+        return bitfield
 
-        allow = deny = 0
-        for role in member.roles:
-            overwrite = self._overwrites.get(role.id)
-            if overwrite:
-                allow |= overwrite.allow.bitfield
-                deny |= overwrite.deny.bitfield
+    def _calculate_permissions(self, guild: "dt_guild.Guild", member: "dt_member.Member") -> int:
+        """
+        Calculates the effective permissions bitfield for the given member, skipping the cache.
+        """
+        default_role = guild.default_role
+        # opt: MemberRoleContainer re-sorts on every iteration, so only iterate it once
+        roles = list(member.roles)
 
-        permissions.bitfield &= ~deny
-        permissions.bitfield |= allow
+        base = reduce(
+            or_, (role.permissions.bitfield for role in roles), default_role.permissions.bitfield
+        )
+        if base & _ADMINISTRATOR:
+            return _ALL_PERMISSIONS
 
-        overwrite_member = self._overwrites.get(member.id)
-        if overwrite_member:
-            permissions.bitfield &= ~overwrite_member.deny.bitfield
-            permissions.bitfield |= overwrite_member.allow.bitfield
+        overwrite_bits = self._overwrite_bits
+        if not overwrite_bits:
+            return base
 
-        return permissions
+        bitfield = base
+        overwrite_everyone = overwrite_bits.get(default_role.id)
+        if overwrite_everyone is not None:
+            bitfield = (bitfield & ~overwrite_everyone[1]) | overwrite_everyone[0]
+
+        role_bits = [overwrite_bits[role.id] for role in roles if role.id in overwrite_bits]
+        allow = reduce(or_, (bits[0] for bits in role_bits), 0)
+        deny = reduce(or_, (bits[1] for bits in role_bits), 0)
+        bitfield = (bitfield & ~deny) | allow
+
+        overwrite_member = overwrite_bits.get(member.id)
+        if overwrite_member is not None:
+            bitfield = (bitfield & ~overwrite_member[1]) | overwrite_member[0]
+
+        return bitfield
 
     def permissions(
         self, obb: "Optional[Union[dt_member.Member, dt_role.Role]]"
@@ -900,29 +1149,29 @@ class Channel(Dataclass):
         If you want to check whether a member has specific permissions, use
         :method:effective_permissions instead.
         """
-        if not self.guild:
-            allow = dt_permissions.Permissions(515136)
-            overwrite = dt_permissions.Overwrite(allow=allow, deny=0, obb=obb, channel_id=self.id)
-            overwrite._immutable = True
-            return overwrite
-        overwrite = self._overwrites.get(obb.id)
-        if not overwrite:
-            everyone_overwrite = self._overwrites.get(self.guild.default_role.id)
-            if everyone_overwrite is None:
-                everyone_perms = self.guild.default_role.permissions
-                everyone_overwrite = dt_permissions.Overwrite(
-                    allow=everyone_perms, deny=dt_permissions.Permissions(0), obb=obb
-                )
-                everyone_overwrite.channel_id = self.id
-                overwrite = everyone_overwrite
+        guild = self.guild
+        if not guild:
+            overwrite = dt_permissions.Overwrite(_PRIVATE_PERMISSIONS, 0, obb, channel_id=self.id)
+        elif not self._overwrite_bits:
+            # fast path: most channels have no overwrites at all, so there's nothing to look up
+            allow = guild.default_role.permissions.bitfield
+            overwrite = dt_permissions.Overwrite(allow, 0, obb, channel_id=self.id)
+        else:
+            overwrite = self._overwrites.get(obb.id)
+            if overwrite is not None:
+                return overwrite
+
+            # fall back to the @everyone overwrite, or the @everyone role if there isn't one
+            default_role = guild.default_role
+            everyone_bits = self._overwrite_bits.get(default_role.id)
+            if everyone_bits is None:
+                allow, deny = default_role.permissions.bitfield, 0
             else:
-                overwrite = dt_permissions.Overwrite(
-                    everyone_overwrite.allow, everyone_overwrite.deny, obb
-                )
+                allow, deny = everyone_bits
 
-            overwrite.channel_id = self.id
-            overwrite._immutable = True
+            overwrite = dt_permissions.Overwrite(allow, deny, obb, channel_id=self.id)
 
+        overwrite._immutable = True
         return overwrite
 
     @property
@@ -936,10 +1185,25 @@ class Channel(Dataclass):
 
         return self.permissions(self.guild.me)
 
+    def __copy__(self) -> "Channel":
+        # opt: the generic copy protocol goes through Dataclass.__new__, which inspects the stack
+        obb = object.__new__(type(self))
+        obb.id = self.id
+        for name in Channel.__slots__:
+            setattr(obb, name, getattr(self, name))
+
+        return obb
+
     def _copy(self) -> "Channel":
-        obb = copy.copy(self)
+        obb = self.__copy__()
         obb._messages = ChannelMessageWrapper(obb)
         obb._overwrites = self._overwrites.copy()
+        obb._overwrites_view = MappingProxyType(obb._overwrites)
+        obb._overwrite_bits = self._overwrite_bits.copy()
+        # The copy starts with the same overwrites version, so the cached entries are still valid
+        # for it. Any later overwrite change bumps the version on the mutated side only.
+        if self._perm_cache is not _EMPTY_MAPPING:
+            obb._perm_cache = self._perm_cache.copy()
         return obb
 
     @deprecated(since="0.7.0", see_instead="Channel.messages.get_history", removal="0.9.0")
@@ -969,13 +1233,12 @@ class Channel(Dataclass):
 
         :return: A list of :class:`.Message` objects.
         """
-        msg_data = await get_current_client().http.get_pins(self.id)
-
-        messages = []
-        for message in msg_data:
-            messages.append(get_current_client().state.make_message(message))
+        client = get_current_client()
+        async with self._http_semaphore:
+            msg_data = await client.http.get_pins(self.id)
 
-        return messages
+        make_message = client.state.make_message
+        return [make_message(message) for message in msg_data]
 
     @property
     def webhooks(self) -> "AsyncIteratorWrapper[dt_webhook.Webhook]":
@@ -991,13 +1254,12 @@ class Channel(Dataclass):
 
         :return: A list of :class:`.Webhook` objects for the channel.
         """
-        webhooks = await get_current_client().http.get_webhooks_for_channel(self.id)
-        obbs = []
-
-        for webhook in webhooks:
-            obbs.append(get_current_client().state.make_webhook(webhook))
+        client = get_current_client()
+        async with self._http_semaphore:
+            webhooks = await client.http.get_webhooks_for_channel(self.id)
 
-        return obbs
+        make_webhook = client.state.make_webhook
+        return [make_webhook(webhook) for webhook in webhooks]
 
     @deprecated(since="0.7.0", see_instead="Channel.messages.get", removal="0.9.0")
     async def get_message(self, message_id: int) -> "dt_message.Message":
@@ -1019,14 +1281,15 @@ class Channel(Dataclass):
         :param avatar: The bytes content of the new webhook.
         :return: A :class:`.Webhook` that represents the webhook created.
         """
-        if not self.effective_permissions(self.guild.me).manage_webhooks:
-            raise PermissionsError("manage_webhooks")
+        self._require_permission(_MANAGE_WEBHOOKS, "manage_webhooks")
 
         if avatar is not None:
-            avatar = base64ify(avatar)
+            avatar = await base64ify_async(avatar)
 
-        data = await get_current_client().http.create_webhook(self.id, name=name, avatar=avatar)
-        webook = get_current_client().state.make_webhook(data)
+        client = get_current_client()
+        async with self._http_semaphore:
+            data = await client.http.create_webhook(self.id, name=name, avatar=avatar)
+        webook = client.state.make_webhook(data)
 
         return webook
 
@@ -1042,18 +1305,21 @@ class Channel(Dataclass):
         :return: The modified :class:`.Webhook`. object.
         """
         if avatar is not None:
-            avatar = base64ify(avatar)
+            avatar = await base64ify_async(avatar)
 
+        http = get_current_client().http
         if webhook.token is not None:
             # Edit it unconditionally.
-            await get_current_client().http.edit_webhook_with_token(
-                webhook.id, webhook.token, name=name, avatar=avatar
-            )
+            async with self._http_semaphore:
+                data = await http.edit_webhook_with_token(
+                    webhook.id, webhook.token, name=name, avatar=avatar
+                )
+        else:
+            self._require_permission(_MANAGE_WEBHOOKS, "manage_webhooks")
 
-        if not self.effective_permissions(self.guild.me).manage_webhooks:
-            raise PermissionsError("manage_webhooks")
+            async with self._http_semaphore:
+                data = await http.edit_webhook(webhook.id, name=name, avatar=avatar)
 
-        data = await get_current_client().http.edit_webhook(webhook.id, name=name, avatar=avatar)
         webhook.default_name = data.get("name")
         webhook._default_avatar = data.get("avatar")
 
@@ -1070,17 +1336,50 @@ class Channel(Dataclass):
 
         :param webhook: The :class:`.Webhook` to delete.
         """
-        if webhook.token is not None:
-            # Delete it unconditionally.
-            await get_current_client().http.delete_webhook_with_token(webhook.id, webhook.token)
-            return webhook
+        result = (await self.delete_webhooks([webhook]))[0]
+        if isinstance(result, Exception):
+            raise result
 
-        if not self.effective_permissions(self.guild.me).manage_webhooks:
-            raise PermissionsError("manage_webhooks")
-
-        await get_current_client().http.delete_webhook(webhook.id)
         return webhook
 
+    async def delete_webhooks(
+        self, webhooks: "List[dt_webhook.Webhook]"
+    ) -> "List[Union[dt_webhook.Webhook, Exception]]":
+        """
+        Deletes multiple webhooks concurrently.
+
+        Webhooks with a token are deleted unconditionally; you must have MANAGE_WEBHOOKS to delete
+        the rest. A failed deletion doesn't stop the others; instead, its error is returned in
+        place of the webhook.
+
+        :param webhooks: The list of :class:`.Webhook` objects to delete.
+        :return: A list with, for each webhook in order, either the webhook if it was deleted or
+            the exception raised whilst deleting it.
+        """
+        if any(webhook.token is None for webhook in webhooks):
+            self._require_permission(_MANAGE_WEBHOOKS, "manage_webhooks")
+
+        http = get_current_client().http
+        results = list(webhooks)
+
+        async def _delete(index: int, webhook: "dt_webhook.Webhook"):
+            try:
+                async with self._http_semaphore:
+                    if webhook.token is not None:
+                        # Delete it unconditionally.
+                        await http.delete_webhook_with_token(webhook.id, webhook.token)
+                    else:
+                        await http.delete_webhook(webhook.id)
+            except Exception as e:
+                # NB: don't let this escape, or the task group would cancel every other deletion
+                results[index] = e
+
+        async with anyio.create_task_group() as tg:
+            for index, webhook in enumerate(webhooks):
+                await tg.spawn(_delete, index, webhook)
+
+        return results
+
     async def create_invite(
         self,
         *,
@@ -1097,19 +1396,60 @@ class Channel(Dataclass):
         :param temporary: Is this invite temporary?
         :param unique: Is this invite unique?
         """
-        if not self.guild:
-            raise PermissionsError("create_instant_invite")
-
-        if not self.effective_permissions(self.guild.me).create_instant_invite:
+        bitfield = self._me_bitfield()
+        if bitfield is None or not bitfield & _CREATE_INSTANT_INVITE:
             raise PermissionsError("create_instant_invite")
 
-        inv = await get_current_client().http.create_invite(
-            self.id, max_age=max_age, max_uses=max_uses, temporary=temporary, unique=unique
-        )
+        async with self._http_semaphore:
+            inv = await get_current_client().http.create_invite(
+                self.id, max_age=max_age, max_uses=max_uses, temporary=temporary, unique=unique
+            )
         invite = dt_invite.Invite(**inv)
 
         return invite
 
+    async def create_invites(
+        self,
+        count: int,
+        *,
+        max_age: Optional[int] = None,
+        max_uses: Optional[int] = None,
+        temporary: Optional[bool] = None,
+        unique: Optional[bool] = None,
+    ) -> "List[dt_invite.Invite]":
+        """
+        Creates multiple invites in this channel concurrently.
+
+        Discord may hand back the same invite for identical requests, so pass ``unique=True`` if
+        every invite should be different.
+
+        :param count: The number of invites to create.
+        :param max_age: The maximum age of the invites.
+        :param max_uses: The maximum uses of the invites.
+        :param temporary: Are these invites temporary?
+        :param unique: Are these invites unique?
+        :return: A list of the :class:`.Invite` objects created.
+        """
+        bitfield = self._me_bitfield()
+        if bitfield is None or not bitfield & _CREATE_INSTANT_INVITE:
+            raise PermissionsError("create_instant_invite")
+
+        http = get_current_client().http
+        invites = [None] * count
+
+        async def _create(index: int):
+            async with self._http_semaphore:
+                inv = await http.create_invite(
+                    self.id, max_age=max_age, max_uses=max_uses, temporary=temporary, unique=unique
+                )
+            invites[index] = dt_invite.Invite(**inv)
+
+        async with anyio.create_task_group() as tg:
+            for index in range(count):
+                await tg.spawn(_create, index)
+
+        return invites
+
     @deprecated(since="0.7.0", see_instead="Channel.messages.delete_messages", removal="0.9.0")
     async def delete_messages(self, messages: "List[dt_message.Message]") -> int:
         """
@@ -1189,11 +1529,10 @@ class Channel(Dataclass):
         if not self.type.has_messages():
             raise CuriousError("Cannot send messages to this channel")
 
-        if self.guild:
-            if not self.effective_permissions(self.guild.me).send_messages:
-                raise PermissionsError("send_message")
+        self._require_permission(_SEND_MESSAGES, "send_message")
 
-        await get_current_client().http.send_typing(self.id)
+        async with self._http_semaphore:
+            await get_current_client().http.send_typing(self.id)
 
     @property
     @asynccontextmanager
@@ -1212,11 +1551,14 @@ class Channel(Dataclass):
             await channel.messages.send("Long action:", res)
         """
 
+        # Send the first one directly, so that errors are raised before the block is entered.
+        await self.send_typing()
+
         async def runner():
-            await self.send_typing()
+            # Typing lasts for ~10 seconds, so refresh it a bit before it expires.
             while True:
+                await anyio.sleep(8)
                 await self.send_typing()
-                await anyio.sleep(4)
 
         async with anyio.create_task_group() as tg:
             await tg.spawn(runner)
@@ -1313,10 +1655,8 @@ class Channel(Dataclass):
         :param overwrite: The specific overwrite to use.
             If this is None, the overwrite will be deleted.
         """
-        if not self.guild:
-            raise PermissionsError("manage_roles")
-
-        if not self.effective_permissions(self.guild.me).manage_roles:
+        bitfield = self._me_bitfield()
+        if bitfield is None or not bitfield & _MANAGE_ROLES:
             raise PermissionsError("manage_roles")
 
         target = overwrite.target
@@ -1326,11 +1666,10 @@ class Channel(Dataclass):
         else:
             type_ = "role"
 
+        client = get_current_client()
         if overwrite is None:
             # Delete the overwrite instead.
-            coro = get_current_client().http.remove_overwrite(
-                channel_id=self.id, target_id=target.id
-            )
+            coro = client.http.remove_overwrite(channel_id=self.id, target_id=target.id)
 
             async def _listener(before, after):
                 if after.id != self.id:
@@ -1340,7 +1679,7 @@ class Channel(Dataclass):
                 return True
 
         else:
-            coro = get_current_client().http.edit_overwrite(
+            coro = client.http.edit_overwrite(
                 self.id,
                 target.id,
                 type_,
@@ -1351,8 +1690,41 @@ class Channel(Dataclass):
             async def _listener(before, after):
                 return after.id == self.id
 
-        async with get_current_client().events.wait_for_manager("channel_update", _listener):
-            await coro
+        async with client.events.wait_for_manager("channel_update", _listener):
+            async with self._http_semaphore:
+                await coro
+
+        return self
+
+    async def set_overwrites(self, overwrites: "List[dt_permissions.Overwrite]") -> "Channel":
+        """
+        Replaces all of the overwrites for this channel in a single request.
+
+        Any existing overwrite whose target is not in ``overwrites`` will be removed.
+
+        :param overwrites: The list of :class:`.Overwrite` objects to set.
+        """
+        bitfield = self._me_bitfield()
+        if bitfield is None or not bitfield & _MANAGE_ROLES:
+            raise PermissionsError("manage_roles")
+
+        payload = [
+            {
+                "id": overwrite.target.id,
+                "type": "member" if isinstance(overwrite.target, dt_member.Member) else "role",
+                "allow": overwrite.allow.bitfield,
+                "deny": overwrite.deny.bitfield,
+            }
+            for overwrite in overwrites
+        ]
+
+        async def _listener(before, after):
+            return after.id == self.id
+
+        client = get_current_client()
+        async with client.events.wait_for_manager("channel_update", _listener):
+            async with self._http_semaphore:
+                await client.http.edit_channel(self.id, permission_overwrites=payload)
 
         return self
 
@@ -1365,7 +1737,7 @@ class Channel(Dataclass):
         bitrate: int = None,
         user_limit: int = -1,
         rate_limit_per_user: int = None,
-        parent: "Channel" = _NONE,
+        parent: "Channel" = _UNSET,
     ) -> "Channel":
         """
         Edits this channel.
@@ -1378,39 +1750,44 @@ class Channel(Dataclass):
         :param rate_limit_per_user: The rate limit per user.
         :param parent: The :class:`.Channel` to set as the category parent for this channel.
         """
-        if self.guild is None:
+        bitfield = self._me_bitfield()
+        if bitfield is None:
             raise CuriousError("Can only edit guild channels")
 
-        if not self.effective_permissions(self.guild.me).manage_channels:
+        if not bitfield & _MANAGE_CHANNELS:
             raise PermissionsError("manage_channels")
 
-        if parent is None:
-            parent = 0
-        elif parent is not self._NONE:
-            if not parent.type == ChannelType.CATEGORY:
-                raise ValueError("Parent channel must be a category")
-            parent = parent.id
+        # -1 leaves the parent unchanged, and 0 removes it
+        if parent is _UNSET:
+            parent_id = -1
+        elif parent is None:
+            parent_id = 0
         else:
-            parent = -1
-
-        await get_current_client().http.edit_channel(
-            self.id,
-            name=name,
-            position=position,
-            topic=topic,
-            bitrate=bitrate,
-            user_limit=user_limit,
-            rate_limit_per_user=rate_limit_per_user,
-            parent_id=parent,
-        )
+            if parent.type != ChannelType.CATEGORY:
+                raise ValueError("Parent channel must be a category")
+            parent_id = parent.id
+
+        async with self._http_semaphore:
+            await get_current_client().http.edit_channel(
+                self.id,
+                name=name,
+                position=position,
+                topic=topic,
+                bitrate=bitrate,
+                user_limit=user_limit,
+                rate_limit_per_user=rate_limit_per_user,
+                parent_id=parent_id,
+            )
+
         return self
 
     async def delete(self) -> "Channel":
         """
         Deletes this channel.
         """
-        if not self.effective_permissions(self.guild.me).manage_channels:
-            raise PermissionsError("manage_channels")
+        self._require_permission(_MANAGE_CHANNELS, "manage_channels")
+
+        async with self._http_semaphore:
+            await get_current_client().http.delete_channel(self.id)
 
-        await get_current_client().http.delete_channel(self.id)
         return self
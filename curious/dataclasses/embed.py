@@ -22,7 +22,7 @@ Wrappers for Embed objects.
 import datetime
 from typing import Optional, Mapping, List
 
-from curious.util import attrdict
+from curious.util import attrdict, to_datetime
 
 
 class Embed(object):  # not an IDObject! Embeds don't have IDs.
@@ -87,6 +87,35 @@ class Embed(object):  # not an IDObject! Embeds don't have IDs.
         #: The thumbnail for this embed.
         self.thumbnail = make_attrdict("thumbnail")
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "Embed":
+        """
+        Creates an embed from an embed dict, as returned from Discord.
+
+        This is equivalent to ``Embed(**data)``, but skips the keyword handling of the constructor,
+        as this is done for every embed of every message received.
+
+        :param data: The embed dict to create the embed from.
+        :return: A new :class:`.Embed`.
+        """
+        obb = cls.__new__(cls)
+        get = data.get
+
+        obb.title = get("title")
+        obb.description = get("description")
+        obb.colour = get("color")
+        # NB: the constructor never picks up ``type`` from Discord, so this doesn't either
+        obb.type_ = None
+        obb.url = get("url")
+        obb.timestamp = to_datetime(get("timestamp"))
+        obb.fields = [attrdict(field) for field in get("fields", ())]
+
+        for key in ("footer", "author", "image", "video", "thumbnail"):
+            value = get(key)
+            setattr(obb, key, attrdict() if value is None else attrdict(value))
+
+        return obb
+
     def add_field(self, *, name: str, value: str, inline: bool = True) -> "Embed":
         """
         Adds a field to the embed.
@@ -105,7 +105,7 @@ class Emoji(PartialEmoji):
         super().__init__(**kwargs)
 
         #: A list of role IDs that this emoji can be used by.
-        self.role_ids: List[int] = kwargs.get("roles", [])
+        self.role_ids: List[int] = [int(role_id) for role_id in kwargs.get("roles", [])]
 
         #: If this emoji requires colons to use.
         self.require_colons: bool = kwargs.get("require_colons", False)
@@ -143,7 +143,9 @@ class Emoji(PartialEmoji):
         """
         :return: A list of :class:`.Role` this emoji can be used by.
         """
+        guild = self.guild
         if len(self.role_ids) <= 0:
-            return [self.guild.default_role]
+            return [guild.default_role]
 
-        return [self.guild.roles[r_id] for r_id in self.role_ids]
+        roles = guild._roles
+        return [roles[r_id] for r_id in self.role_ids]
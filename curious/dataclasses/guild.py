@@ -24,7 +24,6 @@ import copy
 import datetime
 import enum
 from dataclasses import dataclass
-from math import ceil
 from os import PathLike
 from types import MappingProxyType
 from typing import (
@@ -59,10 +58,14 @@ from curious.dataclasses import (
     voice_state as dt_vs,
     webhook as dt_webhook,
 )
-from curious.dataclasses.bases import Dataclass
+from curious.dataclasses.bases import Dataclass, next_version_tag
 from curious.dataclasses.presence import Presence, Status
 from curious.exc import CuriousError, HTTPException, HierarchyError, PermissionsError
-from curious.util import AsyncIteratorWrapper, base64ify, deprecated
+from curious.util import AsyncIteratorWrapper, base64ify_async, deprecated
+
+#: The bits of the guild permissions checked by :class:`.Guild` and :class:`.GuildBanContainer`.
+_KICK_MEMBERS = dt_permissions.PERMISSION_BITS["kick_members"]
+_BAN_MEMBERS = dt_permissions.PERMISSION_BITS["ban_members"]
 
 T = TypeVar("T")
 
@@ -255,12 +258,14 @@ class GuildChannelWrapper(_WrapperBase):
         :param default: The default value to get, if the channel cannot be found.
         :return: A :class:`.Channel` if it can be found.
         """
-        s = sorted(self._guild._channels.values(), key=lambda c: c.position)
-        try:
-            return next(filter(lambda ch: ch.name == name, s))
-        except StopIteration:
+        # opt: min() keeps the first of equal positions, like the stable sort this replaces,
+        # without sorting every channel
+        matches = [ch for ch in self._guild._channels.values() if ch.name == name]
+        if not matches:
             return default
 
+        return min(matches, key=lambda c: c.position)
+
     async def create(
         self,
         name: str,
@@ -446,12 +451,12 @@ class GuildRoleWrapper(_WrapperBase):
         :param default: The default value to get, if the role cannot be found.
         :return: A :class:`.Role` if it can be found.
         """
-        s = sorted(self._guild._roles.values(), key=lambda c: c.position)
-        try:
-            return next(filter(lambda r: r.name == name, s))
-        except StopIteration:
+        matches = [r for r in self._guild._roles.values() if r.name == name]
+        if not matches:
             return default
 
+        return min(matches, key=lambda r: r.position)
+
     async def create(self, **kwargs) -> "dt_role.Role":
         """
         Creates a new role in this guild.
@@ -529,7 +534,7 @@ class GuildEmojiWrapper(_WrapperBase):
         :return: The :class:`.Emoji` created.
         """
         if isinstance(image_data, bytes):
-            image_data = base64ify(image_data)
+            image_data = await base64ify_async(image_data)
 
         if roles is not None:
             roles = [r.id for r in roles]
@@ -563,19 +568,20 @@ class GuildBanContainer(object):
         self._guild = guild
 
     async def __aiter__(self) -> "AsyncGenerator[GuildBan]":
-        if not self._guild.me.guild_permissions.ban_members:
+        if not self._guild.me._guild_permission_bits() & _BAN_MEMBERS:
             raise PermissionsError("ban_members")
 
         client = get_current_client()
         bans = await client.http.get_bans(self._guild.id)
 
+        state = client.state
         for ban in bans:
             user_data = ban.get("user", None)
             if user_data is None:
                 continue
 
-            user = client.state.make_user(user_data)
-            client.state._check_decache_user(user.id)
+            user = state.make_user(user_data)
+            state._check_decache_user(user.id)
             ban = GuildBan(reason=ban.get("reason", None), user=user)
             yield ban
 
@@ -610,7 +616,7 @@ class GuildBanContainer(object):
         :param delete_message_days: The number of days to delete messages.
         :param reason: The reason given for banning.
         """
-        if not self._guild.me.guild_permissions.ban_members:
+        if not self._guild.me._guild_permission_bits() & _BAN_MEMBERS:
             raise PermissionsError("ban_members")
 
         if isinstance(victim, dt_member.Member):
@@ -620,7 +626,7 @@ class GuildBanContainer(object):
             if victim.guild_id != self._guild.id:
                 raise ValueError("Member must be from this guild (try `member.user` instead!)")
 
-            if victim.top_role >= self._guild.me.top_role:
+            if victim._top_role_key() >= self._guild.me._top_role_key():
                 raise HierarchyError("Top role is equal to or lower than victim's top role")
 
             victim_user = victim.user
@@ -672,7 +678,7 @@ class GuildBanContainer(object):
         :param user: The :class:`.User` to forgive and unban.
         :param reason: The reason given for unbanning.
         """
-        if not self._guild.me.guild_permissions.ban_members:
+        if not self._guild.me._guild_permission_bits() & _BAN_MEMBERS:
             raise PermissionsError("ban_members")
 
         forgiven_id = user.id
@@ -710,7 +716,12 @@ class Guild(Dataclass):
         "features",
         "shard_id",
         "_roles",
+        "_roles_version",
         "_members",
+        "_members_version",
+        "_members_snapshot",
+        "_members_by_tag",
+        "_me_id",
         "_channels",
         "_emojis",
         "member_count",
@@ -735,6 +746,9 @@ class Guild(Dataclass):
 
     valid_embed_styles = {"banner1", "banner3", "banner2", "shield", "banner4"}
 
+    #: The dict slots that are copied, rather than shared, by :meth:`._copy`.
+    _copied_slots = ("_channels", "_roles", "_emojis", "_members", "_voice_states")
+
     def __init__(self, **kwargs) -> None:
         super().__init__(kwargs.get("id"))
 
@@ -794,8 +808,20 @@ class Guild(Dataclass):
 
         #: The roles that this guild has.
         self._roles = {}
+        #: The version tag of the roles. This must be bumped whenever a role is changed.
+        self._roles_version = next_version_tag()
         #: The members of this guild.
         self._members = {}
+        #: The version tag of the members. This must be bumped whenever members join or leave.
+        self._members_version = next_version_tag()
+        #: A (version, members) tuple of the members, used by :meth:`.members_list`.
+        self._members_snapshot: Optional[Tuple[int, Tuple[dt_member.Member, ...]]] = None
+        #: A lookup of (username, discriminator) -> member ID, used to find members by their tag.
+        #: This is only filled by lookups, and entries aren't removed when members change names, so
+        #: check them before use.
+        self._members_by_tag: Dict[Tuple[str, str], int] = {}
+        #: The ID of the current user, looked up on first use of :attr:`.me`.
+        self._me_id: Optional[int] = None
         #: The channels of this guild.
         self._channels = {}
         #: The emojis that this guild has.
@@ -834,15 +860,15 @@ class Guild(Dataclass):
 
     def _copy(self) -> "Guild":
         obb = copy.copy(self)
+        # NB: driven by one list of slots, so a copy can't end up pointing at the wrong dict
+        for slot in self._copied_slots:
+            setattr(obb, slot, getattr(self, slot).copy())
+
+        # the wrappers reference their guild, so they have to be re-made for the copy
         obb.channels = GuildChannelWrapper(obb)
         obb.roles = GuildRoleWrapper(obb)
         obb.emojis = GuildEmojiWrapper(obb)
-        obb.bans = GuildRoleWrapper(obb)
-        obb._channels = self._channels.copy()
-        obb._roles = self._roles.copy()
-        obb._emojis = self._roles.copy()
-        obb._members = self._members.copy()
-        obb._voice_states = self._voice_states.copy()
+        obb.bans = GuildBanContainer(obb)
         return obb
 
     def __repr__(self) -> str:
@@ -860,6 +886,23 @@ class Guild(Dataclass):
         """
         return MappingProxyType(self._members)
 
+    def members_list(self) -> "Tuple[dt_member.Member, ...]":
+        """
+        Gets a snapshot of the members of this guild.
+
+        Unlike :attr:`.members`, this won't change if members join or leave the guild whilst it is
+        being iterated over. The same tuple is returned until the members of this guild change.
+
+        :return: A tuple of :class:`.Member` that represent members on this guild.
+        """
+        snapshot = self._members_snapshot
+        if snapshot is not None and snapshot[0] == self._members_version:
+            return snapshot[1]
+
+        members = tuple(self._members.values())
+        self._members_snapshot = (self._members_version, members)
+        return members
+
     @property
     def voice_states(self) -> "Mapping[int, dt_vs.VoiceState]":
         """
@@ -879,7 +922,12 @@ class Guild(Dataclass):
         """
         :return: A :class:`.Member` object that represents the current user in this guild.
         """
-        return self._members[get_current_client().user.id]
+        # opt: the current user never changes, so skip the client lookup after the first time
+        me_id = self._me_id
+        if me_id is None:
+            me_id = self._me_id = get_current_client().user.id
+
+        return self._members[me_id]
 
     @property
     def default_role(self) -> "Optional[dt_role.Role]":
@@ -903,10 +951,7 @@ class Guild(Dataclass):
         """
         :return: A :class:`.Channel` representing the AFK channel for this guild.
         """
-        try:
-            return self._channels[self.afk_channel_id]
-        except IndexError:
-            return None
+        return self._channels.get(self.afk_channel_id)
 
     @property
     def embed_url(self) -> str:
@@ -931,7 +976,8 @@ class Guild(Dataclass):
         """
         A generator that returns the members that match the specified status.
         """
-        for member in self.members.values():
+        # NB: this is a generator, so iterate over a snapshot in case members change in between
+        for member in self.members_list():
             if member.status == status:
                 yield member
 
@@ -1012,12 +1058,21 @@ class Guild(Dataclass):
         if isinstance(discriminator, int):
             discriminator = "{:04d}".format(discriminator)
 
-        for member in self._members.values():
+        if discriminator is not None:
+            # an exact username#discrim match is unique, so it can be looked up directly
+            member = self._get_indexed_member_by_tag(name, discriminator)
+            if member is not None:
+                return member
+
+        for member, user in self._members_with_users():
             # ensure discrim matches first
-            if discriminator is not None and discriminator != member.user.discriminator:
+            if discriminator is not None and discriminator != user.discriminator:
                 continue
 
-            if member.user.username == name:
+            if user.username == name:
+                if discriminator is not None:
+                    self._members_by_tag[(name, discriminator)] = member.id
+
                 return member
 
             if member.nickname == name:
@@ -1036,18 +1091,76 @@ class Guild(Dataclass):
                 could be found.
         """
         sp = search_str.rsplit("#", 1)
-        if len(sp) == 1:
-            # Member name only :(
-            predicate = lambda member: member.user.name == sp[0] or member.nickname == sp[0]
-        else:
+        if len(sp) != 1:
             # Discriminator too!
             # Don't check nicknames for this.
-            predicate = (
-                lambda member: member.user.name == sp[0] and member.user.discriminator == sp[1]
-            )
+            return self._get_member_by_tag(sp[0], sp[1])
+
+        # Member name only :(
+        name = sp[0]
+        for member, user in self._members_with_users():
+            if user.username == name or member.nickname == name:
+                return member
+
+        return None
+
+    def _members_with_users(self) -> "Generator[Tuple[dt_member.Member, dt_user.User], None, None]":
+        """
+        A generator of (member, user) pairs for every member of this guild, for name scans.
+        """
+        # opt: Member.user looks up the current client for every member, so only do it once
+        users = get_current_client().state._users
+        for member in self._members.values():
+            user = users.get(member.id)
+            if user is None:
+                user = member.user
+
+            yield member, user
+
+    def _get_indexed_member_by_tag(
+        self, username: str, discriminator: str
+    ) -> "Optional[dt_member.Member]":
+        """
+        Gets a member by their exact username and discriminator from the tag index only.
+
+        :param username: The username of the member.
+        :param discriminator: The discriminator of the member.
+        :return: The :class:`.Member` with this tag, or None if the index doesn't have it.
+        """
+        key = (username, discriminator)
+        member_id = self._members_by_tag.get(key)
+        if member_id is None:
+            return None
+
+        member = self._members.get(member_id)
+        if member is not None:
+            user = member.user
+            if user.username == username and user.discriminator == discriminator:
+                return member
+
+        # stale entry, the member has left or changed their name
+        del self._members_by_tag[key]
+        return None
 
-        filtered = filter(predicate, self.members.values())
-        return next(filtered, None)
+    def _get_member_by_tag(self, username: str, discriminator: str) -> "Optional[dt_member.Member]":
+        """
+        Gets a member by their exact username and discriminator.
+
+        :param username: The username of the member.
+        :param discriminator: The discriminator of the member.
+        :return: The :class:`.Member` with this tag, or None if no member has it.
+        """
+        member = self._get_indexed_member_by_tag(username, discriminator)
+        if member is not None:
+            return member
+
+        # the index is missing this member, so fall back to a single scan
+        for member, user in self._members_with_users():
+            if user.username == username and user.discriminator == discriminator:
+                self._members_by_tag[(username, discriminator)] = member.id
+                return member
+
+        return None
 
     # creation methods
     def start_chunking(self) -> None:
@@ -1057,7 +1170,8 @@ class Guild(Dataclass):
         This will clear the chunking event, and calculate the number of member chunks required.
         """
         self._finished_chunking.clear()
-        self._chunks_left = ceil(self.member_count / 1000)
+        # integer ceiling division, avoiding a float round-trip
+        self._chunks_left = -(-self.member_count // 1000)
 
     async def wait_until_chunked(self) -> None:
         """
@@ -1077,16 +1191,26 @@ class Guild(Dataclass):
             # We have a new chunk, so decrement the number left.
             self._chunks_left -= 1
 
+        # opt: this runs for every member of every guild on startup, so bind everything locally
+        guild_id = self.id
+        guild_members = self._members
+        added = False
+
         for member_data in members:
             member_id = int(member_data["user"]["id"])
-            if member_id in self._members:
-                member_obj = self._members[member_id]
+            member_obj = guild_members.get(member_id)
+            if member_obj is None:
+                # NB: chunked member objects never have a guild ID of their own
+                member_obj = dt_member.Member(guild_id=guild_id, **member_data)
+                guild_members[member_id] = member_obj
+                added = True
             else:
-                member_obj = dt_member.Member(**member_data)
-                self._members[member_obj.id] = member_obj
+                member_obj.guild_id = guild_id
 
             member_obj.nickname = member_data.get("nick", member_obj.nickname)
-            member_obj.guild_id = self.id
+
+        if added:
+            self._members_version = next_version_tag()
 
     def from_guild_create(self, **data: dict) -> "Guild":
         """
@@ -1125,18 +1249,26 @@ class Guild(Dataclass):
         self.max_members = data.get("max_members", 0)
         self.max_presences = data.get("max_presences", 0)
 
+        # opt: the loops below run over every role, member, channel, etc of the guild, so bind
+        # everything they touch locally
+        guild_id = self.id
+        members = self._members
+        channels = self._channels
+        voice_states = self._voice_states
+
         # Create all the Role objects for the server.
-        for role_data in data.get("roles", []):
-            role_obj = dt_role.Role(**role_data)
-            role_obj.guild_id = self.id
-            self._roles[role_obj.id] = role_obj
+        # NB: role objects never have a guild ID of their own, so it can be passed in directly.
+        roles = (dt_role.Role(guild_id=guild_id, **rd) for rd in data.get("roles", []))
+        self._roles.update((role_obj.id, role_obj) for role_obj in roles)
+
+        self._roles_version = next_version_tag()
 
         # Create all the Member objects for the server.
         self._handle_member_chunk(data.get("members", []))
 
         for presence in data.get("presences", []):
             member_id = int(presence["user"]["id"])
-            member_obj = self._members.get(member_id)
+            member_obj = members.get(member_id)
 
             if not member_obj:
                 continue
@@ -1146,35 +1278,34 @@ class Guild(Dataclass):
         # Create all of the channel objects.
         for channel_data in data.get("channels", []):
             channel_obj = dt_channel.Channel(**channel_data)
-            self._channels[channel_obj.id] = channel_obj
-            channel_obj.guild_id = self.id
+            channels[channel_obj.id] = channel_obj
+            channel_obj.guild_id = guild_id
             channel_obj._update_overwrites(channel_data.get("permission_overwrites", []),)
 
         # Create all of the voice states.
         for vs_data in data.get("voice_states", []):
             user_id = int(vs_data.get("user_id", 0))
-            member = self.members.get(user_id)
+            member = members.get(user_id)
 
             if not member:
                 continue
 
             voice_state = dt_vs.VoiceState(**vs_data)
-            self._voice_states[voice_state.user_id] = voice_state
+            voice_states[voice_state.user_id] = voice_state
 
-            vs_channel = self._channels.get(int(vs_data.get("channel_id", 0)))
+            vs_channel = channels.get(int(vs_data.get("channel_id", 0)))
             if vs_channel is not None:
                 voice_state.channel_id = vs_channel.id
-                voice_state.guild_id = self.id
+                voice_state.guild_id = guild_id
 
         self._handle_emojis(data.get("emojis", []))
 
         return self
 
     def _handle_emojis(self, emojis):
-        for emoji in emojis:
-            emoji_obj = dt_emoji.Emoji(**emoji)
-            self._emojis[emoji_obj.id] = emoji_obj
-            emoji_obj.guild_id = self.id
+        # NB: like roles, emoji objects never have a guild ID of their own
+        emojis = (dt_emoji.Emoji(guild_id=self.id, **emoji) for emoji in emojis)
+        self._emojis.update((emoji_obj.id, emoji_obj) for emoji_obj in emojis)
 
     @property
     def large(self) -> bool:
@@ -1200,7 +1331,7 @@ class Guild(Dataclass):
         :return: The icon URL for this guild, or None if one isn't set.
         """
         if self.icon_hash:
-            return "https://cdn.discordapp.com/icons/{}/{}.webp".format(self.id, self.icon_hash)
+            return f"https://cdn.discordapp.com/icons/{self.id}/{self.icon_hash}.webp"
 
     @property
     def splash_url(self) -> Optional[str]:
@@ -1208,9 +1339,7 @@ class Guild(Dataclass):
         :return: The splash URL for this guild, or None if one isn't set.
         """
         if self.splash_hash:
-            return "https://cdn.discordapp.com/splashes/{}/{}.webp".format(
-                self.id, self.splash_hash
-            )
+            return f"https://cdn.discordapp.com/splashes/{self.id}/{self.splash_hash}.webp"
 
     # Guild methods.
     async def leave(self) -> None:
@@ -1225,7 +1354,7 @@ class Guild(Dataclass):
         :return: A list :class:`.Invite` objects.
         """
         invites = await get_current_client().http.get_invites_for(self.id)
-        invites = [dt_invite.Invite(get_current_client(), **i) for i in invites]
+        invites = [dt_invite.Invite(**i) for i in invites]
 
         try:
             invite = await self.get_vanity_invite()
@@ -1241,7 +1370,8 @@ class Guild(Dataclass):
 
         :param victim: The :class:`.Member` to kick.
         """
-        if not self.me.guild_permissions.kick_members:
+        me = self.me
+        if not me._guild_permission_bits() & _KICK_MEMBERS:
             raise PermissionsError("kick_members")
 
         if self.owner == victim:
@@ -1250,7 +1380,7 @@ class Guild(Dataclass):
         if victim.guild != self:
             raise ValueError("Member must be from this guild (try `member.user` instead)")
 
-        if victim.top_role >= self.me.top_role:
+        if victim._top_role_key() >= me._top_role_key():
             raise HierarchyError("Top role is equal to or lower than victim's top role")
 
         victim_id = victim.user.id
@@ -1345,12 +1475,9 @@ class Guild(Dataclass):
         """
         client = get_current_client()
         webhooks = await client.http.get_webhooks_for_guild(self.id)
-        obbs = []
-
-        for webhook in webhooks:
-            obbs.append(client.state.make_webhook(webhook))
 
-        return obbs
+        make_webhook = client.state.make_webhook
+        return [make_webhook(webhook) for webhook in webhooks]
 
     async def delete_webhook(self, webhook: "dt_webhook.Webhook"):
         """
@@ -1460,7 +1587,7 @@ class Guild(Dataclass):
         if not self.me.guild_permissions.manage_server:
             raise PermissionsError("manage_server")
 
-        image = base64ify(icon_content)
+        image = await base64ify_async(icon_content)
         await get_current_client().http.edit_guild(self.id, icon_content=image)
 
     async def upload_icon(self, path: PathLike):
@@ -21,7 +21,7 @@ Wrappers for Member objects (Users with guilds).
 import collections
 import copy
 import datetime
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 
 from curious.core import get_current_client
 from curious.dataclasses import (
@@ -30,12 +30,20 @@ from curious.dataclasses import (
     user as dt_user,
     voice_state as dt_vs,
 )
-from curious.dataclasses.bases import Dataclass
-from curious.dataclasses.permissions import Permissions
+from curious.dataclasses.bases import Dataclass, next_version_tag
+from curious.dataclasses.permissions import PERMISSION_BITS, Permissions
 from curious.dataclasses.presence import BasicActivity, Presence, RichActivity, Status
 from curious.exc import HierarchyError, PermissionsError
 from curious.util import to_datetime
 
+#: The bits of the guild permissions checked by :class:`.Member`.
+_ADMINISTRATOR = PERMISSION_BITS["administrator"]
+_CHANGE_NICKNAME = PERMISSION_BITS["change_nickname"]
+_MANAGE_NICKNAMES = PERMISSION_BITS["manage_nicknames"]
+_MANAGE_ROLES = PERMISSION_BITS["manage_roles"]
+#: The bitfield of :meth:`.Permissions.all`.
+_ALL_PERMISSIONS = Permissions.all().bitfield
+
 
 class Nickname(object):
     """
@@ -83,21 +91,24 @@ class Nickname(object):
 
         guild: dt_guild.Guild = self.parent.guild
 
+        guild_me = guild.me
+        bitfield = guild_me._guild_permission_bits()
+
         me = False
-        if self.parent == self.parent.guild.me:
+        if self.parent == guild_me:
             me = True
-            if not guild.me.guild_permissions.change_nickname:
+            if not bitfield & _CHANGE_NICKNAME:
                 raise PermissionsError("change_nickname")
         else:
-            if not guild.me.guild_permissions.manage_nicknames:
+            if not bitfield & _MANAGE_NICKNAMES:
                 raise PermissionsError("manage_nicknames")
 
             # we can't change the owner nickname, unless we are the owner
             if guild.owner == self.parent:
                 raise HierarchyError("Cannot change the nickname of the owner")
 
-        if self.parent.top_role >= guild.me.top_role and self.parent != guild.me:
-            raise HierarchyError("Top role is equal to or lower than victim's top role")
+            if self.parent._top_role_key() >= guild_me._top_role_key():
+                raise HierarchyError("Top role is equal to or lower than victim's top role")
 
         if new_nickname is not None and len(new_nickname) > 32:
             raise ValueError("Nicknames cannot be longer than 32 characters")
@@ -178,29 +189,34 @@ class MemberRoleContainer(collections.Sequence):
         :param roles: The :class:`.Role` objects to add to this member's role list.
         """
 
-        if not self._member.guild.me.guild_permissions.manage_roles:
+        guild_me = self._member.guild.me
+        if not guild_me._guild_permission_bits() & _MANAGE_ROLES:
             raise PermissionsError("manage_roles")
 
         # Ensure we can add all of these roles.
+        top_role_key = guild_me._top_role_key()
         for _r in roles:
-            if _r >= self._member.guild.me.top_role:
+            if (_r.position, _r.id) >= top_role_key:
                 msg = "Cannot add role {} - it has a higher or equal position to our top role".format(
                     _r.name
                 )
                 raise HierarchyError(msg)
 
+        # opt: compare raw IDs, as iterating a MemberRoleContainer re-sorts the roles every time
+        target_ids = frozenset(role.id for role in roles)
+
         async def _listener(before, after: Member):
             if after.id != self._member.id:
                 return False
 
-            if not all(role in after.roles for role in roles):
-                return False
-
-            return True
+            return target_ids.issubset(after.role_ids)
 
         client = get_current_client()
         async with client.events.wait_for_manager("guild_member_update", _listener):
-            role_ids = set([_r.id for _r in self._member.roles] + [_r.id for _r in roles])
+            # NB: filter out IDs of deleted roles, which MemberRoleContainer would skip
+            guild_roles = self._member.guild._roles
+            role_ids = {rid for rid in self._member.role_ids if rid in guild_roles}
+            role_ids.update(target_ids)
             await client.http.edit_member_roles(self._member.guild_id, self._member.id, role_ids)
 
     async def remove(self, *roles: "dt_role.Role"):
@@ -209,31 +225,35 @@ class MemberRoleContainer(collections.Sequence):
 
         :param roles: The roles to remove.
         """
-        if not self._member.guild.me.guild_permissions.manage_roles:
+        guild_me = self._member.guild.me
+        if not guild_me._guild_permission_bits() & _MANAGE_ROLES:
             raise PermissionsError("manage_roles")
 
+        top_role_key = guild_me._top_role_key()
         for _r in roles:
-            if _r >= self._member.guild.me.top_role:
+            if (_r.position, _r.id) >= top_role_key:
                 msg = "Cannot remove role {} - it has a higher or equal position to our top role".format(
                     _r.name
                 )
                 raise HierarchyError(msg)
 
+        target_ids = frozenset(role.id for role in roles)
+
         async def _listener(before, after: Member):
             if after.id != self._member.id:
                 return False
 
-            if not all(role not in after.roles for role in roles):
-                return False
-
-            return True
+            return target_ids.isdisjoint(after.role_ids)
 
         # Calculate the roles to keep.
-        to_keep = set(self._member.roles) - set(roles)
+        # opt: diff on raw IDs rather than iterating (and re-sorting) the Role objects
+        guild_roles = self._member.guild._roles
+        role_ids = {
+            rid for rid in self._member.role_ids if rid in guild_roles and rid not in target_ids
+        }
 
         client = get_current_client()
         async with client.events.wait_for_manager("guild_member_update", _listener):
-            role_ids = set([_r.id for _r in to_keep])
             await client.http.edit_member_roles(self._member.guild_id, self._member.id, role_ids)
 
 
@@ -245,6 +265,8 @@ class Member(Dataclass):
     __slots__ = (
         "_user_data",
         "role_ids",
+        "_roles_version",
+        "_guild_perm_cache",
         "joined_at",
         "_nickname",
         "guild_id",
@@ -260,7 +282,15 @@ class Member(Dataclass):
         get_current_client().state.make_user(self._user_data)
 
         #: An iterable of role IDs this member has.
-        self.role_ids = [int(rid) for rid in kwargs.get("roles", [])]
+        # opt: this runs for every member in every chunk, and map() with a builtin calls int
+        # directly in C rather than through a bytecode loop, which is slightly faster
+        self.role_ids = list(map(int, kwargs.get("roles", ())))
+
+        #: The version tag of :attr:`.role_ids`. This must be bumped whenever it changes.
+        self._roles_version = next_version_tag()
+
+        #: The cached (version tag, guild permissions bitfield, top role key) of this member.
+        self._guild_perm_cache: Optional[Tuple[tuple, int, Tuple[int, int]]] = None
 
         #: A :class:`._MemberRoleContainer` that represents the roles of this member.
         self.roles = MemberRoleContainer(self)
@@ -273,7 +303,7 @@ class Member(Dataclass):
         self._nickname = Nickname(self, nick)  # type: Nickname
 
         #: The ID of the guild that this member is in.
-        self.guild_id = None  # type: int
+        self.guild_id = int(kwargs.get("guild_id", 0)) or None  # type: int
 
         #: The current :class:`.Presence` of this member.
         self.presence = Presence(
@@ -417,20 +447,57 @@ class Member(Dataclass):
         """
         :return: The calculated guild permissions for a member.
         """
-        if self == self.guild.owner:
-            return Permissions.all()
+        return Permissions(self._guild_permission_bits())
+
+    def _guild_permission_info(self) -> "Tuple[tuple, int, Tuple[int, int]]":
+        """
+        Gets the guild permissions bitfield and the top role key of this member, using the cache
+        if the member's roles, the guild's roles and the guild owner are all unchanged.
+
+        :return: A tuple of (version tag, permissions bitfield, (top role position, top role ID)).
+        """
+        guild = self.guild
+        tag = (self._roles_version, guild._roles_version, guild.owner_id)
+        cached = self._guild_perm_cache
+        if cached is not None and cached[0] == tag:
+            return cached
+
+        default_role = guild.default_role
+        bitfield = default_role.permissions.bitfield
+        top_role_key = None
+
+        # opt: walk the role IDs directly, rather than re-sorting them via MemberRoleContainer
+        guild_roles = guild._roles
+        for role_id in self.role_ids:
+            role = guild_roles.get(role_id)
+            if role is None:
+                continue
 
-        bitfield = 0
-        # add the default roles
-        bitfield |= self.guild.default_role.permissions.bitfield
-        for role in self.roles:
             bitfield |= role.permissions.bitfield
+            role_key = (role.position, role.id)
+            if top_role_key is None or role_key > top_role_key:
+                top_role_key = role_key
+
+        if top_role_key is None:
+            top_role_key = (default_role.position, default_role.id)
 
-        permissions = Permissions(bitfield)
-        if permissions.administrator:
-            return Permissions.all()
+        if self.id == guild.owner_id or bitfield & _ADMINISTRATOR:
+            bitfield = _ALL_PERMISSIONS
 
-        return permissions
+        cached = self._guild_perm_cache = (tag, bitfield, top_role_key)
+        return cached
+
+    def _guild_permission_bits(self) -> int:
+        """
+        :return: The calculated guild permissions bitfield for this member.
+        """
+        return self._guild_permission_info()[1]
+
+    def _top_role_key(self) -> "Tuple[int, int]":
+        """
+        :return: The (position, ID) of this member's top role, which orders the same as the role.
+        """
+        return self._guild_permission_info()[2]
 
     # Member methods.
     async def send(self, content: str, *args, **kwargs):
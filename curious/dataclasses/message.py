@@ -21,7 +21,10 @@ Wrappers for Message objects.
 import datetime
 import enum
 import re
-from typing import List, Optional, Union
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import anyio
 
 from curious.core import get_current_client
 from curious.dataclasses import (
@@ -30,6 +33,7 @@ from curious.dataclasses import (
     guild as dt_guild,
     invite as dt_invite,
     member as dt_member,
+    permissions as dt_permissions,
     role as dt_role,
     user as dt_user,
     webhook as dt_webhook,
@@ -42,10 +46,67 @@ from curious.exc import CuriousError, ErrorCode, HTTPException, PermissionsError
 from curious.util import AsyncIteratorWrapper, to_datetime
 
 CHANNEL_REGEX = re.compile(r"<#([0-9]*)>")
-INVITE_REGEX = re.compile(r"(?:discord\.gg/(\S+)|discordapp\.com/invites/(\S+))")
+INVITE_REGEX = re.compile(r"discord(?:\.gg|app\.com/invites)/([A-Za-z0-9-]{2,32})(?![A-Za-z0-9-])")
 EMOJI_REGEX = re.compile(r"<a?:([\S]+):([0-9]+)>")
 MENTION_REGEX = re.compile(r"<@!?([0-9]+)>")
 
+#: The bits of the permissions checked by :class:`.Message`.
+_ADD_REACTIONS = dt_permissions.PERMISSION_BITS["add_reactions"]
+_MANAGE_MESSAGES = dt_permissions.PERMISSION_BITS["manage_messages"]
+
+#: The maximum number of invites :meth:`.Message.get_invites` will fetch at once.
+_INVITE_CONCURRENCY = 4
+
+#: The channel, emoji, and invite regexes as one alternation, so content is only scanned once.
+_TOKEN_REGEX = re.compile(
+    r"<#(?P<channel>[0-9]+)>"
+    r"|<a?:(?P<emoji_name>[^\s:]+):(?P<emoji_id>[0-9]+)>"
+    r"|discord(?:\.gg|app\.com/invites)/(?P<invite>[A-Za-z0-9-]{2,32})(?![A-Za-z0-9-])"
+)
+#: The group numbers of :data:`._TOKEN_REGEX`, for dispatching on ``match.lastindex``.
+_CHANNEL_GROUP = _TOKEN_REGEX.groupindex["channel"]
+_EMOJI_NAME_GROUP = _TOKEN_REGEX.groupindex["emoji_name"]
+_EMOJI_ID_GROUP = _TOKEN_REGEX.groupindex["emoji_id"]
+_INVITE_GROUP = _TOKEN_REGEX.groupindex["invite"]
+
+#: A shared, read-only empty mapping, used for messages with no reactions.
+_EMPTY_MAPPING: Mapping = MappingProxyType({})
+
+
+def _reaction_key(
+    emoji: "Union[dt_emoji.PartialEmoji, str, dict, None]"
+) -> "Union[int, str, None]":
+    """
+    Gets the key a reaction with the specified emoji is stored under.
+
+    Custom emojis compare by ID and unicode emojis by their string, so this matches their equality.
+    The emoji may also be the raw emoji data of a reaction event, so the state doesn't have to build
+    an emoji object just to find the reaction.
+    """
+    if emoji is None or isinstance(emoji, str):
+        return emoji
+
+    if isinstance(emoji, dict):
+        emoji_id = emoji.get("id")
+        if emoji_id is None:
+            return emoji.get("name")
+
+        return int(emoji_id)
+
+    return emoji.id
+
+
+def _emoji_api_key(emoji: "Union[dt_emoji.PartialEmoji, str]") -> str:
+    """
+    Gets the form of an emoji used in reaction endpoint URLs.
+
+    Custom emojis are ``name:id`` (undocumented!), and unicode emojis are passed through as-is.
+    """
+    if isinstance(emoji, dt_emoji.PartialEmoji):
+        return f"{emoji.name}:{emoji.id}"
+
+    return emoji
+
 
 class MessageType(enum.IntEnum):
     """
@@ -84,6 +145,11 @@ class MessageType(enum.IntEnum):
     CHANNEL_FOLLOW_ADD = 12
 
 
+#: A lookup of raw type value -> :class:`.MessageType`.
+#: This skips the (comparatively slow) enum call machinery when making every message.
+_MESSAGE_TYPES = {message_type.value: message_type for message_type in MessageType}
+
+
 class Message(Dataclass):
     """
     Represents a Message.
@@ -93,14 +159,19 @@ class Message(Dataclass):
         "content",
         "guild_id",
         "author",
-        "created_at",
-        "edited_at",
+        "_timestamp",
+        "_created_at",
+        "_edited_timestamp",
+        "_edited_at",
         "embeds",
         "attachments",
         "_mentions",
         "_role_mentions",
+        "_tokens",
         "reactions",
+        "_reactions_by_key",
         "channel_id",
+        "_channel",
         "author_id",
         "type",
     )
@@ -117,60 +188,139 @@ class Message(Dataclass):
         #: The ID of the channel the message was sent in.
         self.channel_id: int = int(kwargs.get("channel_id", 0))
 
+        #: The :class:`.Channel` this message was sent in. Looked up when first used.
+        self._channel: Optional[dt_channel.Channel] = None
+
         #: The ID of the author.
-        self.author_id: int = int(kwargs.get("author", {}).get("id", 0)) or None
+        author = kwargs.get("author")
+        self.author_id: int = (int(author.get("id", 0)) or None) if author else None
 
         #: The author of this message. Can be one of: :class:`.Member`, :class:`.Webhook`,
         #: :class:`.User`.
         self.author: Union[dt_member.Member, dt_webhook.Webhook, dt_user.User] = None
 
         type_ = kwargs.get("type", 0)
-        #: The type of this message.
-        self.type: MessageType = MessageType(type_)
-
-        #: The true timestamp of this message, a :class:`datetime.datetime`.
-        #: This is not the snowflake timestamp.
-        self.created_at: datetime.datetime = to_datetime(kwargs.get("timestamp", None))
-
-        #: The edited timestamp of this message.
-        #: This can sometimes be None.
-        self.edited_at: Optional[datetime.datetime] = None
-
-        edited_timestamp = kwargs.get("edited_timestamp", None)
-        if edited_timestamp is not None:
-            self.edited_at = to_datetime(edited_timestamp)
-        else:
-            self.edited_at = None
+        message_type = _MESSAGE_TYPES.get(type_)
+        if message_type is None:
+            # unknown types still go through the enum, so they error as they always have
+            message_type = MessageType(type_)
 
-        #: The list of :class:`.Embed` objects this message contains.
-        self.embeds: List[Embed] = []
-
-        for embed in kwargs.get("embeds", []):
-            self.embeds.append(Embed(**embed))
-
-        #: The list of :class:`.Attachment` this message contains.
-        self.attachments: List[Attachment] = []
+        #: The type of this message.
+        self.type: MessageType = message_type
+
+        # opt: most messages never have their timestamps read, so only parse them on first use
+        #: The raw timestamp of this message.
+        self._timestamp: Optional[str] = kwargs.get("timestamp", None)
+        #: The parsed :attr:`.created_at`, or None if it hasn't been parsed yet.
+        self._created_at: Optional[datetime.datetime] = None
+
+        #: The raw edited timestamp of this message.
+        self._edited_timestamp: Optional[str] = kwargs.get("edited_timestamp", None)
+        #: The parsed :attr:`.edited_at`, or None if it hasn't been parsed yet.
+        self._edited_at: Optional[datetime.datetime] = None
+
+        # opt: most messages have no embeds, attachments, or reactions, so use the shared empty
+        # tuple rather than allocating an empty list for each of them on every message
+        embeds = kwargs.get("embeds")
+        #: The sequence of :class:`.Embed` objects this message contains.
+        self.embeds: Sequence[Embed] = (
+            [Embed.from_dict(embed) for embed in embeds] if embeds else ()
+        )
 
-        for attachment in kwargs.get("attachments", []):
-            self.attachments.append(Attachment(**attachment))
+        attachments = kwargs.get("attachments")
+        #: The sequence of :class:`.Attachment` this message contains.
+        self.attachments: Sequence[Attachment] = (
+            [Attachment(**attachment) for attachment in attachments] if attachments else ()
+        )
 
-        #: The raw mentions for this message.
+        #: The raw mentions for this message, as a mapping of user ID -> user data.
         #: This is UNORDERED.
-        self._mentions: List[str] = kwargs.get("mentions", [])
+        self._mentions: Dict[int, dict] = {}
 
-        #: The raw role mentions for this message.
+        #: The role IDs mentioned in this message.
         #: This is UNORDERED.
-        self._role_mentions: List[str] = kwargs.get("mention_roles", [])
+        self._role_mentions: List[int] = []
+
+        self._update_mentions(kwargs.get("mentions", []), kwargs.get("mention_roles", []))
 
         #: The reactions for this message.
-        self.reactions: List[Reaction] = []
+        self.reactions: Sequence[Reaction] = ()
+
+        #: A lookup of emoji key -> reaction, kept in sync with :attr:`.reactions`.
+        self._reactions_by_key: Mapping[Union[int, str, None], Reaction] = _EMPTY_MAPPING
+
+        #: The (content, channel IDs, emoji (name, ID) pairs, invite codes) parsed from the content.
+        self._tokens: Optional[Tuple[str, List[int], List[Tuple[str, str]], List[str]]] = None
 
     def __repr__(self) -> str:
-        return "<{0.__class__.__name__} id={0.id} content='{0.content}'>".format(self)
+        return f"<{type(self).__name__} id={self.id} content={self.content!r}>"
 
     def __str__(self) -> str:
         return self.content
 
+    @property
+    def created_at(self) -> "Optional[datetime.datetime]":
+        """
+        :return: The true timestamp of this message, a :class:`datetime.datetime`. This is not the
+            snowflake timestamp.
+        """
+        created_at = self._created_at
+        if created_at is None and self._timestamp is not None:
+            created_at = self._created_at = to_datetime(self._timestamp)
+
+        return created_at
+
+    @property
+    def edited_at(self) -> "Optional[datetime.datetime]":
+        """
+        :return: The edited timestamp of this message. This can sometimes be None.
+        """
+        edited_at = self._edited_at
+        if edited_at is None and self._edited_timestamp is not None:
+            edited_at = self._edited_at = to_datetime(self._edited_timestamp)
+
+        return edited_at
+
+    def _update_mentions(
+        self, mentions: Optional[List[dict]], role_mentions: Optional[List[str]]
+    ) -> None:
+        """
+        Updates the raw mentions of this message, parsing their IDs once up front.
+
+        :param mentions: The list of mentioned user dicts, or None to keep the current ones.
+        :param role_mentions: The list of mentioned role IDs, or None to keep the current ones.
+        """
+        if mentions is not None:
+            self._mentions = {int(mention["id"]): mention for mention in mentions}
+
+        if role_mentions is not None:
+            self._role_mentions = [int(role_id) for role_id in role_mentions]
+
+    def _parse_tokens(self) -> "Tuple[str, List[int], List[Tuple[str, str]], List[str]]":
+        """
+        Parses the channel mentions, emojis and invites out of the content of this message.
+
+        The result is cached until the content changes.
+        """
+        content = self.content
+        tokens = self._tokens
+        if tokens is not None and tokens[0] is content:
+            return tokens
+
+        channels, emojis, invites = [], [], []
+        for match in _TOKEN_REGEX.finditer(content):
+            # opt: lastindex is an int, so this dispatches without comparing group name strings
+            index = match.lastindex
+            if index == _CHANNEL_GROUP:
+                channels.append(int(match.group(_CHANNEL_GROUP)))
+            elif index == _EMOJI_ID_GROUP:
+                emojis.append(match.group(_EMOJI_NAME_GROUP, _EMOJI_ID_GROUP))
+            else:
+                invites.append(match.group(_INVITE_GROUP))
+
+        tokens = self._tokens = (content, channels, emojis, invites)
+        return tokens
+
     @property
     def guild(self) -> "dt_guild.Guild":
         """
@@ -183,7 +333,23 @@ class Message(Dataclass):
         """
         :return: The :class:`.Channel` this message is associated with.
         """
-        return get_current_client().state.find_channel(self.channel_id)
+        # opt: find_channel may have to search every guild, and a message never changes channel
+        state = get_current_client().state
+        channel = self._channel
+        if channel is not None:
+            # The state may have replaced the channel (e.g. a guild re-sync) or dropped it (e.g. a
+            # channel delete) since, so only trust the cached object whilst the state still has it.
+            if channel.guild_id is None:
+                channels = state._private_channels
+            else:
+                guild = state._guilds.get(channel.guild_id)
+                channels = guild._channels if guild is not None else _EMPTY_MAPPING
+
+            if channels.get(self.channel_id) is channel:
+                return channel
+
+        channel = self._channel = state.find_channel(self.channel_id)
+        return channel
 
     @property
     def mentions(self) -> "List[dt_member.Member]":
@@ -196,7 +362,7 @@ class Message(Dataclass):
             particular order.
 
         """
-        return self._resolve_mentions(self._mentions, "member")
+        return self._resolve_member_mentions()
 
     @property
     def role_mentions(self) -> "List[dt_role.Role]":
@@ -210,7 +376,7 @@ class Message(Dataclass):
 
         """
 
-        return self._resolve_mentions(self._role_mentions, "role")
+        return self._resolve_role_mentions()
 
     @property
     def channel_mentions(self) -> "List[dt_channel.Channel]":
@@ -222,15 +388,23 @@ class Message(Dataclass):
             These mentions **are** in order. They are parsed from the message content.
 
         """
-        mentions = CHANNEL_REGEX.findall(self.content)
-        return self._resolve_mentions(mentions, "channel")
+        content = self.content
+        # opt: most messages mention no channels, and a substring check is far cheaper than a scan
+        if "<#" not in content:
+            return []
+
+        return self._resolve_channel_mentions(self._parse_tokens()[1])
 
     @property
     def emojis(self) -> "List[Union[dt_emoji.PartialEmoji, dt_emoji.Emoji]]":
         """
         Returns a list of :class:`.Emoji` that was found in this message.
         """
-        matches = EMOJI_REGEX.findall(self.content)
+        content = self.content
+        if "<" not in content or ":" not in content:
+            return []
+
+        matches = self._parse_tokens()[2]
         emojis = []
 
         for (name, i) in matches:
@@ -265,21 +439,32 @@ class Message(Dataclass):
         """
         Gets a list of valid invites in this message.
         """
-        invites = INVITE_REGEX.findall(self.content)
-        obbs = []
-        for match in invites:
-            if match[0]:
-                code = match[0]
-            else:
-                code = match[1]
+        content = self.content
+        if "discord" not in content:
+            return []
 
+        codes = self._parse_tokens()[3]
+        if not codes:
+            return []
+
+        client = get_current_client()
+        obbs = [None] * len(codes)
+        # NB: the content is user-controlled, so don't let one message fire off unlimited requests
+        semaphore = anyio.create_semaphore(_INVITE_CONCURRENCY)
+
+        async def _fetch(index: int, code: str):
             try:
-                obbs.append(await get_current_client().get_invite(code))
+                async with semaphore:
+                    obbs[index] = await client.get_invite(code)
             except HTTPException as e:
                 if e.error_code != ErrorCode.UNKNOWN_INVITE:
                     raise
 
-        return obbs
+        async with anyio.create_task_group() as tg:
+            for index, code in enumerate(codes):
+                await tg.spawn(_fetch, index, code)
+
+        return [obb for obb in obbs if obb is not None]
 
     @property
     def invites(self) -> "AsyncIteratorWrapper[dt_invite.Invite]":
@@ -288,49 +473,87 @@ class Message(Dataclass):
         """
         return AsyncIteratorWrapper(self.get_invites)
 
-    def _resolve_mentions(
-        self, mentions: List[Union[dict, str]], type_: str
-    ) -> "List[Union[dt_channel.Channel, dt_role.Role, dt_member.Member]]":
+    def _resolve_member_mentions(self) -> "List[Union[dt_member.Member, dt_user.User]]":
         """
-        Resolves the mentions for this message.
-        
-        :param mentions: The mentions to resolve; a list of dicts or ints.
-        :param type_: The type of mention to resolve: ``channel``, ``role``, or ``member``.
+        Resolves the user mentions for this message into members, or users in a DM.
         """
-        client = get_current_client()
+        state = get_current_client().state
+        if self.guild_id:
+            cache_finder = self.guild.members.get
+        else:
+            cache_finder = state._users.get
 
         final_mentions = []
-        for mention in mentions:
-            obb = None
-            if type_ == "member":
-                user_id = int(mention["id"])
-                if self.guild_id:
-                    cache_finder = self.guild.members.get
-                else:
-                    cache_finder = client.state._users.get
+        for user_id, user_data in self._mentions.items():
+            obb = cache_finder(user_id)
+            if obb is None:
+                obb = state.make_user(user_data)
+                # always check for a decache
+                state._check_decache_user(user_id)
 
-                obb = cache_finder(user_id)
+            final_mentions.append(obb)
+
+        return final_mentions
 
-                if obb is None:
-                    obb = client.state.make_user(mention)
-                    # always check for a decache
-                    client.state._check_decache_user(user_id)
+    def _resolve_role_mentions(self) -> "List[dt_role.Role]":
+        """
+        Resolves the role mentions for this message.
+        """
+        if self.guild_id is None:
+            return []
 
-            elif type_ == "role":
-                if self.guild_id is None:
-                    return []
+        roles = self.guild._roles
+        return [role for role in map(roles.get, self._role_mentions) if role is not None]
 
-                obb = self.guild.roles.get(int(mention))
-            elif type_ == "channel":
-                if self.guild_id is None:
-                    return []
+    def _resolve_channel_mentions(self, channel_ids: List[int]) -> "List[dt_channel.Channel]":
+        """
+        Resolves the channel mentions for this message.
 
-                obb = self.guild.channels.get(int(mention))
+        :param channel_ids: The channel IDs parsed from the content of this message.
+        """
+        if self.guild_id is None:
+            return []
 
-            if obb is not None:
-                final_mentions.append(obb)
+        channels = self.guild._channels
+        return [channel for channel in map(channels.get, channel_ids) if channel is not None]
 
-        return final_mentions
+    def _find_reaction(self, key: "Union[int, str, None]") -> "Optional[Reaction]":
+        """
+        :param key: The emoji ID for a custom emoji, or the emoji itself for a unicode emoji.
+        :return: The :class:`.Reaction` on this message for that emoji, or None.
+        """
+        return self._reactions_by_key.get(key)
+
+    def _add_reaction(self, reaction: Reaction) -> None:
+        """
+        Adds a reaction to this message.
+        """
+        if not self._reactions_by_key:
+            # the first reaction, so swap out the shared empty containers
+            self.reactions = [reaction]
+            self._reactions_by_key = {_reaction_key(reaction.emoji): reaction}
+            return
+
+        self.reactions.append(reaction)
+        self._reactions_by_key[_reaction_key(reaction.emoji)] = reaction
+
+    def _remove_reaction(self, reaction: Reaction) -> None:
+        """
+        Removes a reaction from this message.
+        """
+        self.reactions.remove(reaction)
+        self._reactions_by_key.pop(_reaction_key(reaction.emoji), None)
+
+    def _clear_reactions(self) -> "List[Reaction]":
+        """
+        Removes all reactions from this message.
+
+        :return: The list of reactions that were removed.
+        """
+        reactions = list(self.reactions)
+        self.reactions = ()
+        self._reactions_by_key = _EMPTY_MAPPING
+        return reactions
 
     def reacted(self, emoji: "Union[dt_emoji.Emoji, str]") -> bool:
         """
@@ -338,11 +561,7 @@ class Message(Dataclass):
 
         :param emoji: The emoji to check.
         """
-        for reaction in self.reactions:
-            if reaction.emoji == emoji:
-                return True
-
-        return False
+        return _reaction_key(emoji) in self._reactions_by_key
 
     # Message methods
     async def delete(self) -> None:
@@ -354,17 +573,14 @@ class Message(Dataclass):
         """
         client = get_current_client()
 
-        if self.guild is None:
-            me = client.user.id
-            has_manage_messages = False
-        else:
-            me = self.guild.me.id
-            has_manage_messages = self.channel.effective_permissions(self.guild.me).manage_messages
-
-        if self.id != me and not has_manage_messages:
-            raise PermissionsError("manage_messages")
+        if self.author_id != client.user.id:
+            # only our own messages can be deleted without MANAGE_MESSAGES, which never applies
+            # outside of a guild
+            bitfield = self.channel._me_bitfield()
+            if bitfield is None or not bitfield & _MANAGE_MESSAGES:
+                raise PermissionsError("manage_messages")
 
-        await client.http.delete_message(self.channel.id, self.id)
+        await client.http.delete_message(self.channel_id, self.id)
 
     async def edit(self, new_content: str = None, *, embed: Embed = None) -> "Message":
         """
@@ -376,10 +592,12 @@ class Message(Dataclass):
         :param embed: The new embed to provide.
         :return: This message, but edited with the new content.
         """
-        if self.guild is None:
-            is_me = self.author not in self.channel.recipients
+        channel = self.channel
+        guild = channel.guild
+        if guild is None:
+            is_me = self.author not in channel.recipients
         else:
-            is_me = self.guild.me == self.author
+            is_me = guild.me == self.author
 
         if not is_me:
             raise CuriousError("Cannot edit messages from other users")
@@ -390,7 +608,7 @@ class Message(Dataclass):
         client = get_current_client()
         async with client.events.wait_for_manager("message_update", lambda o, n: n.id == self.id):
             await client.http.edit_message(
-                self.channel.id, self.id, content=new_content, embed=embed
+                self.channel_id, self.id, content=new_content, embed=embed
             )
         return self
 
@@ -400,11 +618,8 @@ class Message(Dataclass):
 
         You must have MANAGE_MESSAGES in the channel to pin the message.
         """
-        if self.guild is not None:
-            if not self.channel.effective_permissions(self.guild.me).manage_messages:
-                raise PermissionsError("manage_messages")
-
-        await get_current_client().http.pin_message(self.channel.id, self.id)
+        self.channel._require_permission(_MANAGE_MESSAGES, "manage_messages")
+        await get_current_client().http.pin_message(self.channel_id, self.id)
         return self
 
     async def unpin(self) -> "Message":
@@ -414,11 +629,8 @@ class Message(Dataclass):
         You must have MANAGE_MESSAGES in this channel to unpin the message.
         Additionally, the message must already be pinned.
         """
-        if self.guild is not None:
-            if not self.channel.effective_permissions(self.guild.me).manage_messages:
-                raise PermissionsError("manage_messages")
-
-        await get_current_client().http.unpin_message(self.channel.id, self.id)
+        self.channel._require_permission(_MANAGE_MESSAGES, "manage_messages")
+        await get_current_client().http.unpin_message(self.channel_id, self.id)
         return self
 
     async def get_who_reacted(
@@ -430,26 +642,16 @@ class Message(Dataclass):
         :param emoji: The emoji to check.
         :return: A list of either :class:`.Member` or :class:`.User` that reacted to this message.
         """
-        if isinstance(emoji, dt_emoji.Emoji):
-            emoji = "{}:{}".format(emoji.name, emoji.id)
-
+        emoji = _emoji_api_key(emoji)
         reactions = await get_current_client().http.get_reaction_users(
-            self.channel.id, self.id, emoji
+            self.channel_id, self.id, emoji
         )
-        result = []
+        guild = self.guild
+        if guild is None:
+            return [dt_user.User(**user) for user in reactions]
 
-        for user in reactions:
-            member_id = int(user.get("id"))
-            if self.guild is None:
-                result.append(dt_user.User(**user))
-            else:
-                member = self.guild.members.get(member_id)
-                if not member:
-                    result.append(dt_user.User(**user))
-                else:
-                    result.append(member)
-
-        return result
+        members = guild._members
+        return [members.get(int(user.get("id"))) or dt_user.User(**user) for user in reactions]
 
     async def react(self, emoji: "Union[dt_emoji.Emoji, str]") -> None:
         """
@@ -460,18 +662,15 @@ class Message(Dataclass):
 
         :param emoji: The emoji to react with.
         """
-        if self.guild:
-            if not self.channel.effective_permissions(self.guild.me).add_reactions:
-                # we can still add already reacted emojis
-                # so make sure to check for that
-                if not self.reacted(emoji):
-                    raise PermissionsError("add_reactions")
-
-        if isinstance(emoji, dt_emoji.Emoji):
-            # undocumented!
-            emoji = "{}:{}".format(emoji.name, emoji.id)
+        bitfield = self.channel._me_bitfield()
+        if bitfield is not None and not bitfield & _ADD_REACTIONS:
+            # we can still add already reacted emojis
+            # so make sure to check for that
+            if not self.reacted(emoji):
+                raise PermissionsError("add_reactions")
 
-        await get_current_client().http.add_reaction(self.channel.id, self.id, emoji)
+        emoji = _emoji_api_key(emoji)
+        await get_current_client().http.add_reaction(self.channel_id, self.id, emoji)
 
     async def unreact(
         self, reaction: "Union[dt_emoji.Emoji, str]", victim: "dt_member.Member" = None
@@ -482,31 +681,28 @@ class Message(Dataclass):
         :param reaction: The reaction to remove.
         :param victim: The victim to remove the reaction of. Can be None to signify ourselves.
         """
-        if not self.guild:
-            if victim and victim != self:
+        if victim and victim != self:
+            bitfield = self.channel._me_bitfield()
+            if bitfield is None:
                 raise CuriousError("Cannot delete other reactions in a DM")
 
-        if victim and victim != self:
-            if not self.channel.effective_permissions(self.guild.me).manage_messages:
+            if not bitfield & _MANAGE_MESSAGES:
                 raise PermissionsError("manage_messages")
 
-        if isinstance(reaction, dt_emoji.Emoji):
-            emoji = "{}:{}".format(reaction.name, reaction.id)
-        else:
-            emoji = reaction
-
+        emoji = _emoji_api_key(reaction)
         await get_current_client().http.delete_reaction(
-            self.channel.id, self.id, emoji, victim=victim.id if victim else None
+            self.channel_id, self.id, emoji, victim=victim.id if victim else None
         )
 
     async def remove_all_reactions(self) -> None:
         """
         Removes all reactions from a message.
         """
-        if not self.guild:
+        bitfield = self.channel._me_bitfield()
+        if bitfield is None:
             raise CuriousError("Cannot delete other reactions in a DM")
 
-        if not self.channel.effective_permissions(self.guild.me).manage_messages:
+        if not bitfield & _MANAGE_MESSAGES:
             raise PermissionsError("manage_messages")
 
-        await get_current_client().http.delete_all_reactions(self.channel.id, self.id)
+        await get_current_client().http.delete_all_reactions(self.channel_id, self.id)
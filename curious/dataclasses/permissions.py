@@ -451,6 +451,10 @@ class Permissions(object):
 
 perm_thint = Union[int, Permissions]
 
+#: The bit of every permission by name, as a plain int.
+#: This is for hot paths that check raw bitfields without building a :class:`.Permissions`.
+PERMISSION_BITS = {name: 1 << bit for name, bit in Permissions.PERMISSION_MAPPING.items()}
+
 
 class Overwrite(object):
     """
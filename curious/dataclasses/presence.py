@@ -312,6 +312,8 @@ class ClientStatus(object):
     platform (desktop, web, mobile).
     """
 
+    __slots__ = ("_client_status",)
+
     def __init__(self, **client_status):
         self._client_status = client_status
 
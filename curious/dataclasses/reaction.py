@@ -33,6 +33,8 @@ class Reaction(object):
     Represents a reaction.
     """
 
+    __slots__ = ("message", "emoji", "count", "me")
+
     def __init__(self, **kwargs) -> None:
         #: The :class:`.Message` this reaction is for.
         self.message: dt_message.Message = None
@@ -89,8 +89,9 @@ class VoiceState(object):
         return self._server_deaf or self._self_deaf
 
     def __repr__(self):
-        return "<VoiceState user={} deaf={} mute={} channel={}>".format(
-            self.member.user, self.deafened, self.muted, self.channel
+        return (
+            f"<VoiceState user={self.member.user} deaf={self.deafened} mute={self.muted} "
+            f"channel={self.channel}>"
         )
 
     async def mute(self):
@@ -28,7 +28,7 @@ from curious.dataclasses import (
     user as dt_user,
 )
 from curious.dataclasses.bases import Dataclass
-from curious.util import base64ify
+from curious.util import base64ify_async
 
 
 class Webhook(Dataclass):
@@ -176,7 +176,7 @@ class Webhook(Dataclass):
         :return: The webhook object.
         """
         if avatar is not None:
-            avatar = base64ify(avatar)
+            avatar = await base64ify_async(avatar)
 
         if self.token is not None:
             # edit with token, don't pass to guild
@@ -210,6 +210,27 @@ def base64ify(image_data: bytes):
     return "data:{};base64,{}".format(mimetype, b64_data)
 
 
+#: Images larger than this are base64-ified in a worker thread.
+_BASE64IFY_THREAD_THRESHOLD = 64 * 1024
+
+
+async def base64ify_async(image_data: bytes) -> str:
+    """
+    Base64-ifys an image to send to discord, without blocking the event loop for large images.
+
+    :param image_data: The data of the image to use.
+    :return: A string containing the encoded image.
+    """
+    if len(image_data) > _BASE64IFY_THREAD_THRESHOLD:
+        return await anyio.run_in_thread(base64ify, image_data)
+
+    return base64ify(image_data)
+
+
+#: :meth:`datetime.datetime.fromisoformat`, or None if this Python version doesn't have it.
+_fromisoformat = getattr(datetime.datetime, "fromisoformat", None)
+
+
 def to_datetime(timestamp: str) -> Optional[datetime.datetime]:
     """
     Converts a Discord-formatted timestamp to a datetime object.
@@ -223,6 +244,13 @@ def to_datetime(timestamp: str) -> Optional[datetime.datetime]:
     if timestamp.endswith("+00:00"):
         timestamp = timestamp[:-6]
 
+    # opt: fromisoformat is implemented in C and much faster than strptime, but is 3.7+ only
+    if _fromisoformat is not None:
+        try:
+            return _fromisoformat(timestamp)
+        except ValueError:
+            pass
+
     try:
         return datetime.datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%S.%f")
     except ValueError: